@@ -0,0 +1,36 @@
+"""
+This package contains the app: the arithmetic operations and the conversions between bases, and the ways of
+running them (the interactive menu, the batch mode, the service, ...).
+The modules are imported at their first use (for example, logic_project.conversions imports only the conversions
+and the modules they need), so importing the package is fast and has no side effects. The tables of the
+conversions are also created at their first use.
+The interactive app is started by start.py (or by "python -m logic_project").
+"""
+
+from importlib import import_module
+
+# The modules of the package
+MODULES = ("base_number", "batch", "benchmarks", "codec", "conversions", "executor", "functions",
+           "instrumentation", "operations", "parallel", "planner", "power_cache", "service", "start", "steps",
+           "streaming", "ui", "vectorized")
+
+__all__ = list(MODULES)
+
+
+def __getattr__(name):
+    """
+    This function imports a module of the package at its first use (after that, the module is an attribute
+    of the package, so this function isn't called again for it).
+    :param name: The name of the module
+    :return: The module
+    """
+    if name in MODULES:
+        return import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    """
+    :return: The names of the package, including the modules not imported yet
+    """
+    return sorted(set(globals()) | set(MODULES))
@@ -0,0 +1,7 @@
+"""
+This module starts the application when the package is run ("python -m logic_project", see start.py).
+"""
+
+from .start import main
+
+main()
@@ -0,0 +1,231 @@
+"""
+This module contains the BaseNumber type, a natural number in a certain base stored in limbs, so that
+the arithmetic operations work on groups of digits instead of one digit at a time.
+"""
+
+from array import array
+
+from .functions import digit_groups
+from .power_cache import CACHE
+from .functions import FORMATS
+
+
+def limb_digits(p):
+    """
+    This function computes and returns how many digits in a base [p] are stored in a limb, so that
+    a limb (p^k) fits in a machine word (and the sum of two limbs too).
+    The values are computed once, in LIMB_DIGITS.
+    :param p: The base
+    :return: The number of digits of a limb
+    """
+    return LIMB_DIGITS[p]
+
+
+def count_limb_digits(p):
+    """
+    This function computes and returns the biggest [k] such that p^k fits in a machine word.
+    :param p: The base
+    :return: The number of digits of a limb
+    """
+    k = 1
+    while p ** (k + 1) < 1 << 63:
+        k += 1
+    return k
+
+
+# The number of digits of a limb, for every base
+LIMB_DIGITS = {p: count_limb_digits(p) for p in range(2, 37)}
+
+
+class BaseNumber:
+    """
+    This class represents a natural number in a base [p], stored as a list of limbs.
+    A limb is a group of [k] digits (see limb_digits), kept as an integer smaller than p^k.
+    The limbs are kept from right to left (the first limb holds the last digits), so that the operations
+    can be done from right to left without reversing anything. The most significant limb is never zero
+    (except for the number zero, which has a single limb).
+    """
+    __slots__ = ("base", "limbs")
+
+    def __init__(self, base, limbs):
+        """
+        :param base: The base of the number
+        :param limbs: The limbs of the number (an array of integers, from right to left)
+        """
+        self.base = base
+        self.limbs = limbs
+
+    @classmethod
+    def from_string(cls, p, number):
+        """
+        This function creates a BaseNumber from a number in a base [p] given as a string.
+        The string is cut into groups of [k] digits from right to left, and every group is converted directly.
+        :param p: The base of the number
+        :param number: The number (in string format)
+        :return: The BaseNumber
+        """
+        k = limb_digits(p)
+        first = len(number) % k  # The first limb (the leftmost one) may have less than [k] digits
+        limbs = array("Q", [int(number[i:i + k], p) for i in range(len(number) - k, first - 1, -k)])
+        if first or not limbs:
+            limbs.append(int(number[:first] or "0", p))
+        while len(limbs) > 1 and limbs[-1] == 0:
+            limbs.pop()  # We remove the leading zeros (the zero limbs at the end)
+        return cls(p, limbs)
+
+    def pieces(self):
+        """
+        This function generates the limbs of the number written in base [p], each one with exactly [k] digits
+        (with leading zeros), from right to left.
+        A limb is written with the built-in format (if the base has one), or as two halves, with a table of all
+        the groups of [size] digits.
+        :return: The generator of the pieces (in string format)
+        """
+        p, limbs = self.base, self.limbs
+        k = limb_digits(p)
+        if p in FORMATS:
+            spec = "0%d%s" % (k, FORMATS[p])
+            for limb in limbs:
+                yield format(limb, spec)
+            return
+        size = k // 2
+        while p ** size > 4096:
+            size -= 1
+        groups = CACHE.lookup(("groups", p, size), lambda: digit_groups(p, size))
+        group_power = p ** size
+        for limb in limbs:
+            digits = []
+            for i in range(0, k, size):
+                limb, group = divmod(limb, group_power)
+                digits.append(groups[group])
+            yield "".join(reversed(digits))[-k:]
+
+    def to_string(self, width=0):
+        """
+        This function converts the number into a string.
+        The most significant limb is written without leading zeros, and all the others with exactly [k] digits.
+        :param width: The minimum number of digits (the number is completed with leading zeros)
+        :return: The number in base [p] (in string format)
+        """
+        pieces = list(self.pieces())
+        pieces.reverse()
+        pieces[0] = pieces[0].lstrip("0") or "0"
+        return "".join(pieces).rjust(width, "0")
+
+    def write(self, out, width=0):
+        """
+        This function writes the number into a buffer, with the same digits as to_string.
+        The buffer is resized once (to the number of digits) and filled from right to left, limb by limb,
+        so nothing is reversed or joined.
+        :param out: The buffer (a bytearray, whose contents are replaced)
+        :param width: The minimum number of digits (the number is completed with leading zeros)
+        :return: The buffer
+        """
+        k = limb_digits(self.base)
+        pieces = self.pieces()
+        length = len(self.limbs) * k  # The buffer is first filled with all the digits of the limbs
+        if len(out) != max(length, width):
+            out[:] = bytes(max(length, width))
+        position = len(out)
+        for piece in pieces:
+            out[position - k:position] = piece.encode("ascii")
+            position -= k
+        out[:position] = b"0" * position  # The leading zeros up to [width]
+        top = len(out) - max(width, 1)  # The leading zeros of the most significant limb are removed
+        zeros = 0
+        while zeros < top and out[zeros] == 48:  # 48 is the code of "0"
+            zeros += 1
+        del out[:zeros]
+        return out
+
+    def __len__(self):
+        """
+        :return: The number of digits of the number (without leading zeros)
+        """
+        p, top = self.base, self.limbs[-1]
+        digits = 1
+        while top >= p:
+            top //= p
+            digits += 1
+        return (len(self.limbs) - 1) * limb_digits(p) + digits
+
+    def compare(self, other):
+        """
+        This function compares the number with another number in the same base.
+        The number with more limbs is the bigger one. In case of equality, the limbs are compared from
+        left to right until one is bigger.
+        :param other: The other number
+        :return: 1 if the number is bigger, -1 if it is smaller, 0 if they are equal
+        """
+        a, b = self.limbs, other.limbs
+        if len(a) != len(b):
+            return 1 if len(a) > len(b) else -1
+        for i in range(len(a) - 1, -1, -1):
+            if a[i] != b[i]:
+                return 1 if a[i] > b[i] else -1
+        return 0
+
+    def __eq__(self, other):
+        return self.compare(other) == 0
+
+    def __lt__(self, other):
+        return self.compare(other) < 0
+
+    def __le__(self, other):
+        return self.compare(other) <= 0
+
+    def __gt__(self, other):
+        return self.compare(other) > 0
+
+    def __ge__(self, other):
+        return self.compare(other) >= 0
+
+    def __add__(self, other):
+        """
+        This function adds two numbers, limb by limb from right to left, as in the addition digit by digit:
+        the sum of the limbs (and the carry) is kept modulo p^k, and the carry (at most 1) goes to the next limb.
+        :param other: The other number
+        :return: The sum (a new BaseNumber)
+        """
+        a, b = self.limbs, other.limbs
+        if len(a) < len(b):
+            a, b = b, a
+        limit = self.base ** limb_digits(self.base)
+        result = array("Q", a)  # The remaining limbs of the longer number are copied as they are
+        carry = 0
+        for i in range(len(b)):
+            partial_result = a[i] + b[i] + carry
+            carry = partial_result >= limit
+            result[i] = partial_result - limit if carry else partial_result
+        i = len(b)
+        while carry and i < len(a):  # The carry may still propagate through the remaining limbs
+            carry = result[i] == limit - 1
+            result[i] = 0 if carry else result[i] + 1
+            i += 1
+        if carry:
+            result.append(1)
+        return BaseNumber(self.base, result)
+
+    def __sub__(self, other):
+        """
+        This function subtracts a number from a bigger (or equal) one, limb by limb from right to left:
+        if the difference of the limbs (minus the borrow) is negative, we add p^k and borrow from the next limb.
+        :param other: The other number (not bigger than this one)
+        :return: The difference (a new BaseNumber)
+        """
+        a, b = self.limbs, other.limbs
+        limit = self.base ** limb_digits(self.base)
+        result = array("Q", a)
+        borrow = 0
+        for i in range(len(b)):
+            partial_result = a[i] - b[i] - borrow
+            borrow = partial_result < 0
+            result[i] = partial_result + limit if borrow else partial_result
+        i = len(b)
+        while borrow:  # The number is not smaller, so the borrow stops before the last limb
+            borrow = result[i] == 0
+            result[i] = limit - 1 if borrow else result[i] - 1
+            i += 1
+        while len(result) > 1 and result[-1] == 0:
+            result.pop()
+        return BaseNumber(self.base, result)
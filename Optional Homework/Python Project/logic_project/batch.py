@@ -0,0 +1,149 @@
+"""
+This module contains the batch mode of the app, functions that read jobs (arithmetic operations or
+conversions), one on every line, and write their results as a stream, without any interaction.
+A job is written as the name of the operation or conversion, followed by the bases and the numbers:
+    add <base> <number> <number>              (also: sub, multiply)
+    mul <base> <number> <digit>               (also: div)
+    divide <base> <number> <number> [<fractional digits>]
+    successive <source base> <destination base> <number>
+    (also: substitution, intermediate, rapid)
+The result of every job is written on its own line (or "error: " and the reason, if the job is not valid).
+"""
+
+import sys
+
+from . import operations
+from . import conversions
+from .functions import valid_base
+from .codec import get_codec
+
+# The number of results written at once
+BUFFER_LINES = 4096
+# The operations: the function and the kind of its second operand ("number" or "digit")
+OPERATIONS = {"add": (operations.addition, "number"),
+              "sub": (operations.subtraction, "number"),
+              "mul": (operations.multiplication, "digit"),
+              "div": (operations.division, "digit"),
+              "multiply": (operations.multiply, "number")}
+# The conversions, by their method
+CONVERSIONS = {"successive": conversions.successive_divisions,
+               "substitution": conversions.substitution_method,
+               "intermediate": conversions.intermediate_base,
+               "rapid": conversions.rapid_conversions}
+
+
+def base(p):
+    """
+    This function validates and returns a base (from a job).
+    :param p: The base (in string format)
+    :return: The base (an integer)
+    """
+    if not valid_base(p):
+        raise Exception("The base is not valid.")
+    return int(p)
+
+
+def number(p, n):
+    """
+    This function validates and returns a number in a base [p] (from a job), without leading zeros
+    and with uppercase digits.
+    :param p: The base of the number
+    :param n: The number
+    :return: The number
+    """
+    try:
+        return get_codec(p).normalize(n)  # Stripped, validated and uppercased in a single pass
+    except ValueError:
+        raise Exception("The number is not valid in the selected base.")
+
+
+def execute_job(job):
+    """
+    This function performs a job and returns its result.
+    The bases and the numbers are validated as in the interactive app.
+    :param job: The job (a line, with the name of the operation or conversion, the bases and the numbers)
+    :return: The result of the job (in string format)
+    """
+    fields = job.split()
+    if not fields:
+        raise Exception("The job is empty.")
+    name = fields[0].lower()
+    if name in OPERATIONS and len(fields) == 4:
+        function, operand = OPERATIONS[name]
+        p = base(fields[1])
+        n1, n2 = number(p, fields[2]), number(p, fields[3])
+        if operand == "digit" and len(n2) != 1:
+            raise Exception("The digit is not valid in the selected base.")
+        if name == "div" and n2 == "0":
+            raise Exception("The digit for division cannot be zero.")
+        return str(function(p, n1, n2))
+    if name == "divide" and len(fields) in (4, 5):
+        p = base(fields[1])
+        n1, n2 = number(p, fields[2]), number(p, fields[3])
+        if n2 == "0":
+            raise Exception("The divisor cannot be zero.")
+        if len(fields) == 5 and not fields[4].isdigit():
+            raise Exception("The number of fractional digits is not valid.")
+        precision = int(fields[4]) if len(fields) == 5 else 10
+        return "%s %s" % operations.divide(p, n1, n2, precision)
+    if name in CONVERSIONS and len(fields) == 4:
+        b, h = base(fields[1]), base(fields[2])
+        return str(CONVERSIONS[name](b, h, number(b, fields[3])))
+    raise Exception("The job is not valid.")
+
+
+def job_result(job):
+    """
+    This function performs a job and returns the line with its result (or with the error, if the job
+    is not valid).
+    :param job: The job
+    :return: The line of the result
+    """
+    try:
+        return execute_job(job)
+    except Exception as e:
+        return "error: %s" % e
+
+
+def run_batch(jobs, output, workers=1):
+    """
+    This function performs the jobs (one on every line) and writes their results, in the same order,
+    one on every line. The results are written BUFFER_LINES at a time.
+    With more than one worker, the jobs are performed in parallel (see executor.run_jobs).
+    :param jobs: The jobs (a file or any iterable of lines)
+    :param output: The file where the results are written
+    :param workers: The number of worker processes
+    :return: The number of jobs
+    """
+    jobs = (job for job in jobs if job.strip())  # The empty lines are skipped
+    if workers == 1:
+        lines = map(job_result, jobs)
+    else:
+        from .executor import run_jobs
+        lines = run_jobs(jobs, workers)
+    count = 0
+    results = []
+    for line in lines:
+        results.append(line)
+        count += 1
+        if len(results) == BUFFER_LINES:
+            output.write("\n".join(results) + "\n")
+            results = []
+    if results:
+        output.write("\n".join(results) + "\n")
+    output.flush()
+    return count
+
+
+def main(path, workers=1):
+    """
+    This function starts the batch mode, reading the jobs from a file (or from the standard input, if the
+    path is "-") and writing the results to the standard output.
+    :param path: The path of the file with the jobs
+    :param workers: The number of worker processes
+    """
+    if path == "-":
+        run_batch(sys.stdin, sys.stdout, workers)
+    else:
+        with open(path) as jobs:
+            run_batch(jobs, sys.stdout, workers)
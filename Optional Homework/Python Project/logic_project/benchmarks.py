@@ -0,0 +1,288 @@
+"""
+This module contains the benchmarks of the app, functions that measure how long the operations and the
+conversions take for numbers of different lengths, and how much memory they use.
+Started as "python -m logic_project.benchmarks", it runs the benchmark suite (see run_suite), which can be saved
+as a JSON baseline and compared with a previous baseline (the run fails if it regressed, see regressions):
+    python -m logic_project.benchmarks [--bases 2,10,16] [--max-digits <number>] [--save <file>]
+                                       [--baseline <file>] [--threshold <fraction>]
+Started with "--crossover", it prints the crossovers of the divide-and-conquer conversions.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from timeit import Timer
+
+from . import operations
+from . import conversions
+from .functions import char
+
+# The version of the format of the baselines (a baseline with another version is not compared)
+BASELINE_VERSION = 1
+# The bases of the suite (all the valid bases)
+SUITE_BASES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 16)
+# The lengths (in digits) of the numbers of the suite
+SUITE_LENGTHS = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6)
+# The time (in seconds) of a repetition of a case (a case that takes longer is measured only once)
+CASE_SECONDS = 0.02
+# By default, a case regressed if it takes 25% more time (or memory) than in the baseline
+REGRESSION_THRESHOLD = 0.25
+# Below this time (in seconds), the differences are only noise, so they are not regressions
+NOISE_SECONDS = 0.0005
+# Below this memory (in bytes), the differences are only noise, so they are not regressions
+NOISE_BYTES = 4096
+
+
+def random_number(p, length):
+    """
+    This function creates and returns a random number with [length] digits in a base [p] (with no leading zeros).
+    :param p: The base of the number
+    :param length: The number of digits
+    :return: The number (in string format)
+    """
+    first = char(random.randrange(1, p))
+    return first + "".join(char(random.randrange(p)) for i in range(length - 1))
+
+
+def measure(function, *args):
+    """
+    This function measures and returns the time (in seconds) of a call of a function with the given arguments.
+    The call is repeated until it takes at least 0.2 seconds, and we keep the best of 3 repetitions.
+    :param function: The measured function
+    :param args: The arguments of the function
+    :return: The time of one call, in seconds
+    """
+    timer = Timer(lambda: function(*args))
+    number, elapsed = timer.autorange()
+    return min([elapsed] + timer.repeat(repeat=2, number=number)) / number
+
+
+def crossover(method, b, h, lengths=(16, 32, 64, 128, 256, 512, 1024, 2048)):
+    """
+    This function compares a conversion method (in its original form, digit by digit) with the divide-and-conquer
+    method, for numbers of different lengths, and returns the first length from which the divide-and-conquer
+    method is faster.
+    :param method: The conversion method (successive_divisions or substitution_method)
+    :param b: The source base
+    :param h: The destination base
+    :param lengths: The lengths (in digits) of the compared numbers
+    :return: The list of (length, time of the method, time of divide-and-conquer), and the crossover length
+    (or None, if the method was always faster)
+    """
+    threshold = conversions.DIVIDE_AND_CONQUER_DIGITS
+    conversions.DIVIDE_AND_CONQUER_DIGITS = sys.maxsize  # The method always uses its original form
+    try:
+        rows = []
+        for length in lengths:
+            n = random_number(b, length)
+            rows.append((length, measure(method, b, h, n), measure(conversions.divide_and_conquer, b, h, n)))
+    finally:
+        conversions.DIVIDE_AND_CONQUER_DIGITS = threshold
+    for length, method_time, divide_and_conquer_time in rows:
+        if divide_and_conquer_time < method_time:
+            return rows, length
+    return rows, None
+
+
+def print_crossover(method, b, h):
+    """
+    This function prints the comparison made by [crossover], as a table.
+    :param method: The conversion method
+    :param b: The source base
+    :param h: The destination base
+    """
+    rows, length = crossover(method, b, h)
+    print(method.__name__, "from base", b, "to base", h)
+    print("%10s %16s %20s" % ("digits", "method (ms)", "divide-and-conquer (ms)"))
+    for row in rows:
+        print("%10d %16.3f %20.3f" % (row[0], row[1] * 1000, row[2] * 1000))
+    print("Crossover:", length, "digits")
+
+
+def operation_cases(p, length):
+    """
+    This function creates the cases of the suite for the operations in a base [p], on numbers with [length]
+    digits (the divisors of divide have half of the digits).
+    :param p: The base of the numbers
+    :param length: The number of digits
+    :return: The list of (name, function, arguments, number of digits of the input)
+    """
+    n1, n2, d = random_number(p, length), random_number(p, length), char(random.randrange(1, p))
+    half = random_number(p, max(length // 2, 1))
+    return [("addition", operations.addition, (p, n1, n2), 2 * length),
+            ("subtraction", operations.subtraction, (p, n1, n2), 2 * length),
+            ("multiplication", operations.multiplication, (p, n1, d), length + 1),
+            ("division", operations.division, (p, n1, d), length + 1),
+            ("multiply", operations.multiply, (p, n1, n2), 2 * length),
+            ("divide", operations.divide, (p, n1, half), length + len(half))]
+
+
+def conversion_cases(b, h, length):
+    """
+    This function creates the cases of the suite for the conversions from a base [b] to a base [h], of a number
+    with [length] digits (the rapid conversions only for the bases with a common root).
+    :param b: The source base
+    :param h: The destination base
+    :param length: The number of digits
+    :return: The list of (name, function, arguments, number of digits of the input)
+    """
+    n = random_number(b, length)
+    methods = [conversions.successive_divisions, conversions.substitution_method, conversions.intermediate_base,
+               conversions.divide_and_conquer]
+    if conversions.common_root(b, h) is not None:
+        methods.append(conversions.rapid_conversions)
+    return [(method.__name__, method, (b, h, n), length) for method in methods]
+
+
+def measure_case(function, args):
+    """
+    This function measures a case of the suite: the time of a call and the peak of the memory allocated during
+    a call (with tracemalloc, on a separate call, since tracing slows it down).
+    Unlike measure, the fast calls are repeated only for about CASE_SECONDS (the best of 3 repetitions),
+    and the calls slower than that are measured only once, so that the whole suite runs in a reasonable time.
+    :param function: The measured function
+    :param args: The arguments of the function
+    :return: The time (in seconds) and the peak memory (in bytes)
+    """
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    if elapsed < CASE_SECONDS:
+        number = int(CASE_SECONDS / max(elapsed, 1e-7)) + 1
+        elapsed = min(Timer(lambda: function(*args)).repeat(repeat=3, number=number)) / number
+    tracemalloc.start()
+    try:
+        function(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_suite(bases=SUITE_BASES, lengths=SUITE_LENGTHS, report=None):
+    """
+    This function runs the benchmark suite: every operation in every base and every conversion between every
+    pair of different bases, on numbers of every length. The random numbers are the same on every run.
+    :param bases: The bases
+    :param lengths: The lengths (in digits) of the numbers
+    :param report: A function called with the key and the result of every case, as soon as it's measured
+    :return: The results: for every case (key "name/source base/destination base/digits", the operations
+    having a single base), the time (in seconds), the throughput (in input digits per second) and the peak memory
+    """
+    random.seed(0)
+    results = {}
+    for length in lengths:
+        cases = []
+        for b in bases:
+            cases += [("%s/%d/%d" % (name, b, length), function, args, digits)
+                      for name, function, args, digits in operation_cases(b, length)]
+            for h in bases:
+                if b != h:
+                    cases += [("%s/%d/%d/%d" % (name, b, h, length), function, args, digits)
+                              for name, function, args, digits in conversion_cases(b, h, length)]
+        for key, function, args, digits in cases:
+            elapsed, peak = measure_case(function, args)
+            results[key] = {"seconds": elapsed, "digits_per_second": digits / elapsed, "peak_bytes": peak}
+            if report is not None:
+                report(key, results[key])
+    return results
+
+
+def save_baseline(path, results):
+    """
+    This function saves the results of the suite as a baseline (a JSON file).
+    :param path: The path of the file
+    :param results: The results (see run_suite)
+    """
+    with open(path, "w") as file:
+        json.dump({"version": BASELINE_VERSION, "python": platform.python_version(), "results": results},
+                  file, indent=1, sort_keys=True)
+
+
+def load_baseline(path):
+    """
+    This function loads the results of a baseline (a JSON file saved by save_baseline).
+    :param path: The path of the file
+    :return: The results (see run_suite)
+    """
+    with open(path) as file:
+        baseline = json.load(file)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError("The baseline has another version, please save it again.")
+    return baseline["results"]
+
+
+def regressions(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    This function compares the results of the suite with a baseline, and returns the cases that regressed:
+    the ones that take more than (1 + [threshold]) times the time of the baseline (except the differences below
+    NOISE_SECONDS) or the memory of the baseline (except the differences below NOISE_BYTES).
+    The cases that are not in both are skipped.
+    :param results: The results (see run_suite)
+    :param baseline: The results of the baseline
+    :param threshold: The allowed growth (as a fraction)
+    :return: The list of (key, measure, value in the baseline, value now)
+    """
+    regressed = []
+    for key in sorted(set(results) & set(baseline)):
+        old, new = baseline[key], results[key]
+        if new["seconds"] > old["seconds"] * (1 + threshold) and new["seconds"] - old["seconds"] > NOISE_SECONDS:
+            regressed.append((key, "seconds", old["seconds"], new["seconds"]))
+        if new["peak_bytes"] > old["peak_bytes"] * (1 + threshold) and \
+                new["peak_bytes"] - old["peak_bytes"] > NOISE_BYTES:
+            regressed.append((key, "peak_bytes", old["peak_bytes"], new["peak_bytes"]))
+    return regressed
+
+
+def print_result(key, result):
+    """
+    This function prints the result of a case of the suite, on a line.
+    :param key: The key of the case
+    :param result: The result of the case
+    """
+    print("%-40s %12.3f ms %14.0f digits/s %12d bytes" % (key, result["seconds"] * 1000,
+                                                           result["digits_per_second"], result["peak_bytes"]))
+
+
+def main(argv=None):
+    """
+    This function runs the benchmarks from the command line (see the description of the module).
+    :param argv: The arguments (by default, the ones of the command line)
+    :return: The exit status: 0, or 1 if a case regressed
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks of the operations and of the conversions.")
+    parser.add_argument("--crossover", action="store_true", help="print the crossovers of the conversions")
+    parser.add_argument("--bases", default=",".join(map(str, SUITE_BASES)), help="the bases, separated by commas")
+    parser.add_argument("--max-digits", type=int, default=SUITE_LENGTHS[-1], help="the longest numbers")
+    parser.add_argument("--save", help="save the results as a baseline in this file")
+    parser.add_argument("--baseline", help="compare the results with the baseline from this file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="the allowed growth")
+    args = parser.parse_args(argv)
+    if args.crossover:
+        print_crossover(conversions.substitution_method, 2, 10)
+        print_crossover(conversions.substitution_method, 7, 16)
+        print_crossover(conversions.successive_divisions, 10, 2)
+        print_crossover(conversions.successive_divisions, 16, 7)
+        return 0
+    bases = [int(p) for p in args.bases.split(",")]
+    if any(p not in SUITE_BASES for p in bases):
+        parser.error("the bases must be some of: %s" % ", ".join(map(str, SUITE_BASES)))
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    results = run_suite(bases, [length for length in SUITE_LENGTHS if length <= args.max_digits], print_result)
+    if args.save:
+        save_baseline(args.save, results)
+    if baseline is None:
+        return 0
+    regressed = regressions(results, baseline, args.threshold)
+    for key, measure_name, old, new in regressed:
+        print("Regression: %s %s %.6g -> %.6g (%+.0f%%)" % (key, measure_name, old, new, (new / old - 1) * 100))
+    print("%d cases compared, %d regressions" % (len(set(results) & set(baseline)), len(regressed)))
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+This module contains the codecs of the numbers, objects that read and write the numbers in a certain base
+with translation tables, instead of calling value or char for every digit.
+A codec strips a number (the spaces around it and its leading zeros), validates it and decodes it into a digit
+buffer (the values of the digits, one byte for every digit), and encodes a digit buffer back into a number.
+The codecs work for any base up to 36 (with the digits 0-9 and A-Z), or with a custom alphabet.
+"""
+
+# The digits of the bases up to 36
+DIGITS_36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# The value of the characters that are not digits, in the decoding tables
+INVALID = 255
+
+
+class Codec:
+    """
+    This class represents the codec of a base: the table of the values of all the characters (bytes) and the table
+    of the characters of all the values, so that a whole number is decoded or encoded by a single translation.
+    """
+
+    __slots__ = ("base", "alphabet", "decoding", "encoding")
+
+    def __init__(self, base, alphabet=None, ignore_case=True):
+        """
+        :param base: The base
+        :param alphabet: The digits of the base, in order (by default, the first [base] digits of DIGITS_36)
+        :param ignore_case: True if the lowercase and the uppercase letters are the same digit
+        (unless both of them are in the alphabet)
+        """
+        if alphabet is None:
+            if not 2 <= base <= len(DIGITS_36):
+                raise ValueError("The base must be between 2 and %d." % len(DIGITS_36))
+            alphabet = DIGITS_36[:base]
+        if len(alphabet) != base or len(set(alphabet)) != base or any(ord(digit) > 127 for digit in alphabet):
+            raise ValueError("The alphabet must have %d different ASCII characters." % base)
+        self.base = base
+        self.alphabet = alphabet
+        decoding = bytearray([INVALID]) * 256
+        for digit_value, digit in enumerate(alphabet):
+            if ignore_case:
+                for variant in (digit.lower(), digit.upper()):
+                    if variant not in alphabet:
+                        decoding[ord(variant)] = digit_value
+            decoding[ord(digit)] = digit_value
+        self.decoding = bytes(decoding)
+        encoding = bytearray(256)
+        encoding[:base] = alphabet.encode("ascii")
+        self.encoding = bytes(encoding)
+
+    def decode(self, number, strip=True):
+        """
+        This function validates a number and decodes it into a digit buffer.
+        The number is translated at once into the values of its digits (the characters that are not digits
+        become INVALID), so both the validation and the decoding take a single pass.
+        :param number: The number (a string, or a buffer: bytes, a bytearray or a memoryview)
+        :param strip: True if the spaces around the number and its leading zeros are removed (one zero is kept
+        for the number zero)
+        :return: The digit buffer (bytes or a bytearray, the value of every digit, from left to right)
+        """
+        if isinstance(number, str):
+            try:
+                number = number.encode("ascii")
+            except UnicodeEncodeError:
+                raise ValueError("The number is not valid in base %d." % self.base)
+        elif isinstance(number, memoryview):
+            number = number.tobytes()  # The translation makes a new buffer anyway
+        if strip:
+            number = number.strip()
+        digits = number.translate(self.decoding)
+        if not digits or INVALID in digits:
+            raise ValueError("The number is not valid in base %d." % self.base)
+        if strip:
+            digits = digits.lstrip(b"\0") or b"\0"
+        return digits
+
+    def encode(self, digits):
+        """
+        This function encodes a digit buffer into a number, translating all the values into digits at once.
+        :param digits: The digit buffer (bytes, a bytearray or a list of values, from left to right)
+        :return: The number (in string format)
+        """
+        return bytes(digits).translate(self.encoding).decode("ascii")
+
+    def valid(self, number):
+        """
+        This function verifies and returns if a number (exactly as it is, with no spaces) is valid in the base.
+        :param number: The number
+        :return: True if the number is valid, False otherwise
+        """
+        try:
+            self.decode(number, False)
+        except ValueError:
+            return False
+        return True
+
+    def normalize(self, number):
+        """
+        This function validates a number and returns it in its usual form: without the spaces around it and
+        without leading zeros, and with the digits of the alphabet (so uppercase letters, by default).
+        :param number: The number
+        :return: The number (in string format)
+        """
+        return self.encode(self.decode(number))
+
+
+CODECS = {}  # The codecs already created, by their base, alphabet and case
+
+
+def get_codec(base, alphabet=None, ignore_case=True):
+    """
+    This function returns the codec of a base (see Codec), which is created only once.
+    :param base: The base
+    :param alphabet: The digits of the base (by default, the first [base] digits of DIGITS_36)
+    :param ignore_case: True if the lowercase and the uppercase letters are the same digit
+    :return: The codec
+    """
+    key = (base, alphabet, ignore_case)
+    if key not in CODECS:
+        CODECS[key] = Codec(base, alphabet, ignore_case)
+    return CODECS[key]
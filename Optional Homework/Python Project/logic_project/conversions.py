@@ -0,0 +1,371 @@
+"""
+This module contains the conversions parts, functions that do conversions of natural numbers
+between certain bases.
+The numbers can be given as strings or as buffers (bytes, bytearray or memoryview, with the ASCII digits).
+The results are strings, or, if a buffer [out] (a bytearray) is given, they are written into it.
+The steps of a conversion are given to its [trace] (see steps.py), if one is given.
+"""
+
+from .functions import value
+from .functions import char
+from .functions import remove_leading_zeros
+from .functions import to_integer
+from .functions import from_integer
+from .functions import FORMATS
+from .functions import digits_of
+from .functions import write_output
+from .functions import write_integer
+from .codec import get_codec
+from .operations import addition
+from .operations import multiplication
+
+# From this length (in digits), the conversions use the divide-and-conquer method (see benchmarks.crossover)
+DIVIDE_AND_CONQUER_DIGITS = 64
+# The maximum size of the tables used for the rapid conversions
+TABLE_SIZE = 4096
+
+
+def root(p):
+    """
+    This function computes and returns the smallest number [r] such that the base [p] is a power of [r],
+    and the exponent [x] (so p = r^x).
+    :param p: The base
+    :return: The root [r] and the exponent [x]
+    """
+    for r in range(2, p + 1):
+        x, power = 1, r
+        while power < p:
+            power *= r
+            x += 1
+        if power == p:
+            return r, x
+
+
+def common_root(b, h):
+    """
+    This function verifies if two bases [b] and [h] are powers of a common root, so that the rapid conversions
+    can be used between them (for example 2 for the bases 4 and 16, or 3 for the bases 3 and 9).
+    :param b: The first base
+    :param h: The second base
+    :return: The common root, or None if the bases don't have one
+    """
+    if root(b)[0] == root(h)[0]:
+        return root(b)[0]
+    return None
+
+
+def root_groups(h, size):
+    """
+    This function creates the table of the rapid conversions into a base [h] = r^x from its root [r]: for every
+    [size]-digit number in base [h], the corresponding [size * x] digits in base [r] and the number itself.
+    The table is built by joining the groups of [x] digits in base [r] one after another.
+    :param h: The destination base
+    :param size: The number of digits in base [h]
+    :return: A dictionary from the numbers in base [r] to the numbers in base [h] (in string format)
+    """
+    r, x = root(h)
+    groups = []
+    for d in range(h):
+        digits = ""
+        for i in range(x):
+            digits = char(d // r ** i % r) + digits
+        groups.append((digits, char(d)))
+    table = [("", "")]
+    for i in range(size):
+        table = [(root_digits + group_digits, digits + digit)
+                 for root_digits, digits in table for group_digits, digit in groups]
+    return dict(table)
+
+
+def table_digits(h):
+    """
+    This function computes and returns how many digits in a base [h] are converted at once from its root,
+    so that the table has at most TABLE_SIZE elements.
+    :param h: The destination base
+    :return: The number of digits in base [h]
+    """
+    size = 1
+    while h ** (size + 1) <= TABLE_SIZE:
+        size += 1
+    return size
+
+
+TABLES = {}  # The tables of the rapid conversions already created (at their first use), by their kind and base
+
+
+def to_root_table(b):
+    """
+    This function returns the table of the rapid conversions from a base [b] = r^x into its root [r]:
+    the translation of every digit into [x] digits in base [r]. The table is created only once.
+    :param b: The source base
+    :return: The translation table
+    """
+    key = ("to_root", b)
+    if key not in TABLES:
+        TABLES[key] = str.maketrans({digit: root_digits for root_digits, digit in root_groups(b, 1).items()})
+    return TABLES[key]
+
+
+def from_root_table(h):
+    """
+    This function returns the table of the rapid conversions into a base [h] = r^x from its root [r]:
+    the digits corresponding to every number with (table_digits * x) digits in base [r] (see root_groups).
+    The table is created only once.
+    :param h: The destination base
+    :return: The table
+    """
+    key = ("from_root", h)
+    if key not in TABLES:
+        TABLES[key] = root_groups(h, table_digits(h))
+    return TABLES[key]
+
+
+def byte_table():
+    """
+    This function returns the table of the 4 digits in base 4 of every byte (every number with 8 binary
+    digits). The table is created only once.
+    :return: The list of the digits, by the value of the byte
+    """
+    key = ("byte", 4)
+    if key not in TABLES:
+        groups = root_groups(4, 4)
+        TABLES[key] = [groups[format(d, "08b")] for d in range(256)]
+    return TABLES[key]
+
+
+def successive_divisions(b, h, n, out=None, trace=None):
+    """
+    This function converts a number [n] from base [b] to base [h] by using successive divisions.
+    This method is primarily used for conversions with a source base greater than a destination base.
+    For this, we perform a division between the number [n] and the base [h], in the base [b].
+    The remainder will be a digit in the result (but in reverse order), and on the quotient we perform
+    the same algorithm (until the quotient becomes zero).
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    if len(n) >= DIVIDE_AND_CONQUER_DIGITS:
+        return divide_and_conquer(b, h, n, out, trace)
+    n = list(get_codec(b).decode(n))  # The values of the digits
+    if trace is not None:
+        trace("number", base=b, digits=get_codec(b).encode(n))
+    result = bytearray(len(n) * (b - 1).bit_length() // (h.bit_length() - 1) + 1)  # At least the number of
+    # digits of the result, which are filled from right to left (the remainders are the last digits first)
+    position = len(result)
+    while n != [0]:
+        partial_result, remainder, dividend = 0, 0, []
+        for digit in n:
+            partial_result = partial_result * b + digit  # We "lower" the next digit
+            dividend.append(partial_result // h)
+            partial_result %= h  # As in division, this will be in the result
+        remainder = partial_result
+        position -= 1
+        result[position] = remainder
+        zeros = next((i for i, digit in enumerate(dividend) if digit), len(dividend) - 1)
+        n = dividend[zeros:]  # The quotient kept for the next operations, with leading zeros removed
+        if trace is not None:
+            trace("division", divisor=h, quotient=get_codec(b).encode(n), remainder=char(remainder))
+    del result[:min(position, len(result) - 1)]  # The unused digits (the number zero keeps one digit)
+    return write_output(result.translate(get_codec(h).encoding), out)
+
+
+def divide_and_conquer(b, h, n, out=None, trace=None):
+    """
+    This function converts a number [n] from base [b] to base [h], using a divide-and-conquer method.
+    It does the same thing as the successive divisions, but instead of dividing by [h] once for every digit
+    of the result, the number is divided by a big power h^k, so that the quotient and the remainder
+    (which are half as long) are converted in the same way. The powers h^k (built by squaring) are shared
+    by all the divisions on the same level, so long numbers are converted much faster.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    x = to_integer(b, digits_of(n))
+    if trace is not None:
+        trace("divide_and_conquer", source_base=b, destination_base=h, digits=len(n), bits=x.bit_length())
+    if out is not None:
+        return write_integer(h, x, out)
+    return from_integer(h, x)
+
+
+def substitution_method(b, h, n, out=None, trace=None):
+    """
+    This function converts a number [n] from base [b] to base [h], using the substitution method.
+    This method is primarily used for conversions with a destination base greater than a source base
+    (otherwise, the divide-and-conquer method is used).
+    For this, the digits are converted into base [h] (since [h] > [b], the digits remain the same).
+    Then, each digit is multiplied by a corresponding power of the source base, but in the destination base.
+    All of these multiplications are added together, making the result.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    if len(n) >= DIVIDE_AND_CONQUER_DIGITS or b > h:  # The digit [b] must exist in base [h]
+        return divide_and_conquer(b, h, n, out, trace)
+    n = get_codec(b).normalize(n)[::-1]  # The digits, as a string (the number is short)
+    power = "1"  # The initial power is [b] at power 0, which is equal to 1.
+    result = multiplication(h, n[0], power)
+    if trace is not None:
+        trace("partial_sum", power=power, digit=n[0], partial_result=result, result=result)
+    for i in range(1, len(n)):
+        power = multiplication(h, power, char(b))  # We create the next power, by multiplying the current one with [b]
+        digit = n[i]
+        partial_result = multiplication(h, power, digit)  # We create the partial result, by multiplying the power
+        # with the digit
+        result = addition(h, result, partial_result)  # We add the partial result to the whole result
+        if trace is not None:
+            trace("partial_sum", power=power, digit=digit, partial_result=partial_result, result=result)
+    return write_output(result, out)
+
+
+def intermediate_base(b, h, n, out=None, trace=None):
+    """
+    This function converts a number [n] from a base [b] to a base [h], using base 10 as an intermediate
+    base.
+    For this, the number is first converted into base 10 (an integer), exactly:
+    1. Short numbers (and numbers in a power of 2) are parsed directly, by Horner's rule
+    (every digit is added to the number multiplied by [b]).
+    2. Long numbers are split in halves, which are converted separately and combined with a power of [b].
+    For converting the number from base 10 to base [h], we compute it the following way:
+    1. The number is split by a power of [h]: the quotient gives the first digits and the remainder the last ones.
+    2. We repeat the same for the quotient and the remainder, until the pieces are small enough to
+    write them directly.
+    There are no floating point operations, so the result is exact for numbers of any length.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    base_10_number = to_integer(b, digits_of(n))
+    if trace is not None:
+        trace("intermediate", base=b, number=n, value=base_10_number)
+    if out is not None:
+        return write_integer(h, base_10_number, out)
+    return from_integer(h, base_10_number)
+
+
+def convert_to_root(b, n, trace=None):
+    """
+    This function converts a number [n] from a base [b] to its root [r], using rapid conversions.
+    Suppose we write the base [b] as b = r^x (for example 16 = 2^4, or 9 = 3^2).
+    Then, we replace every digit of the number with [x] digits in base [r], by computing the corresponding
+    [x]-digit number.
+    The [x]-digit numbers of all the digits are computed once (see to_root_table), so the replacement is
+    a simple translation of the string.
+    :param b: The source base (a power of a smaller number)
+    :param n: The number (initially in the source base)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [r]
+    """
+    table = to_root_table(b)
+    if trace is not None:
+        trace("to_root", base=b, root=root(b)[0], groups=((digit, digit.translate(table)) for digit in n))
+    return remove_leading_zeros(n.translate(table))
+
+
+def convert_from_root(h, n, trace=None):
+    """
+    This function converts a number [n] from the root [r] of a base [h] to the base [h], using rapid conversions.
+    Suppose we write the base [h] as r^x.
+    Then, we will make groups of [x] digits (from right to left), and every [x] digits will be converted into
+    one digit, that will replace on the same position those [x] digits in the final result.
+    Since we may not have a multiple of [x] as a number of digits, we add as many leading zeros as we need.
+    The groups are converted several at a time: the groups of (table_digits * x) digits are looked up in
+    a table (see from_root_table) that gives the corresponding digits, so we add leading zeros up to a multiple of
+    that size, and the extra leading digits are removed at the end.
+    :param h: The destination base (a power of a smaller number)
+    :param n: The number (initially in base [r])
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    x = root(h)[1]
+    table = from_root_table(h)
+    size = table_digits(h) * x  # The number of digits in base [r] converted at once
+    length = -(-len(n) // x)  # The number of digits of the result
+    n = n.rjust(-(-len(n) // size) * size, "0")  # We add leading zeros to have whole groups
+    if trace is not None:
+        trace("from_root", base=h, root=root(h)[0],
+              groups=((n[i:i + size], table[n[i:i + size]]) for i in range(0, len(n), size)))
+    result = "".join([table[n[i:i + size]] for i in range(0, len(n), size)])
+    return result[len(result) - length:]
+
+
+def convert_to_2(b, n, trace=None):
+    """
+    This function converts a number [n] from a base [b] to base 2, using rapid conversions. For this,
+    the source base [b] must be a power of 2 (since we won't convert a number already in base 2,
+    [b] must be from the set {4,8,16}).
+    Every digit is replaced with its binary digits (see convert_to_root).
+    :param b: The source base (from {4,8,16})
+    :param n: The number (initially in the source base)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base 2
+    """
+    return convert_to_root(b, n, trace)
+
+
+def convert_from_2(h, n, trace=None):
+    """
+    This function converts a number [n] from base 2 to base [h], using rapid conversions. For this, the
+    destination base must be a power of 2 (since we won't convert a number that is in base 2 into the same base,
+    [h] must be from the set {4,8,16}).
+    Every group of binary digits is replaced with a digit in base [h] (see convert_from_root).
+    :param h: The destination base (from {4,8,16})
+    :param n: The number (initially in base 2)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    return convert_from_root(h, n, trace)
+
+
+def rapid_conversions(b, h, n, out=None, trace=None):
+    """
+    This function converts a number [n] from a base [b] to a base [h] using rapid conversions. For this,
+    the bases must be powers of a common root [r] (for example {2,4,8,16}, or {3,9}).
+    First, the number is converted from base [b] to base [r] (if necessary), then from base [r] into base [h]
+    (if necessary), creating the final result.
+    If the bases don't have a common root, the conversion is done using base 10 as an intermediate base.
+    When the bases are powers of 2 and the destination base has a built-in format (2, 8 or 16), the same
+    regrouping of the binary digits is done by the built-in conversions (which work in linear time on the binary
+    representation). For base 4, the binary representation is taken byte by byte, and every byte is replaced
+    with its 4 digits from a table (see byte_table).
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The converted number in base [h]
+    """
+    r = common_root(b, h)
+    if r is None:
+        return intermediate_base(b, h, n, out, trace)
+    n = digits_of(n)
+    if trace is None and r == 2 and (n[:1] not in ("0", b"0") or len(n) == 1):  # The fast paths remove the
+        # leading zeros, so the number must have none (and they don't have digit groups to show)
+        if h in FORMATS:
+            return write_output(format(int(n, b), FORMATS[h]), out)
+        if h == 4:
+            number = int(n, b)
+            data = number.to_bytes((number.bit_length() + 7) // 8 or 1, "big")
+            return write_output(remove_leading_zeros("".join(map(byte_table().__getitem__, data))), out)
+    if not isinstance(n, str):
+        n = n.decode("ascii")  # The tables of the rapid conversions translate strings
+    if b != r:
+        result = convert_to_root(b, n, trace)  # We only convert to base [r] if it's not already converted
+    else:
+        result = n
+    if h != r:
+        result = convert_from_root(h, result, trace)  # We only convert it to base [h] if it's not already
+        # converted
+    return write_output(result, out)
@@ -0,0 +1,77 @@
+"""
+This module contains the parallel executor, functions that perform batches of jobs (see batch.py) on
+several processes, since every operation and conversion uses a single core.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from itertools import islice
+
+from .batch import job_result
+
+# The number of characters of the jobs sent to a worker at once (so that the pickling cost is amortized)
+CHUNK_CHARS = 1 << 16
+# Below this number of jobs, the jobs are performed in the current process
+PARALLEL_JOBS = 2048
+# The number of chunks waiting for every worker (more chunks are read only when the results are written)
+PENDING_CHUNKS = 4
+
+
+def run_chunk(jobs):
+    """
+    This function performs a chunk of jobs (in a worker process) and returns their results.
+    :param jobs: The list of jobs
+    :return: The list of the lines of the results
+    """
+    return [job_result(job) for job in jobs]
+
+
+def chunks(jobs, chunk_chars):
+    """
+    This function groups the jobs in chunks of about [chunk_chars] characters.
+    :param jobs: The jobs (any iterable of lines)
+    :param chunk_chars: The number of characters of a chunk
+    :return: A generator of the chunks (lists of jobs)
+    """
+    chunk, size = [], 0
+    for job in jobs:
+        chunk.append(job)
+        size += len(job)
+        if size >= chunk_chars:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+
+def run_jobs(jobs, workers=None, chunk_chars=CHUNK_CHARS):
+    """
+    This function performs the jobs on several worker processes, and generates their results in the same
+    order as the jobs.
+    1. The jobs are grouped in chunks, and every chunk is sent to a worker.
+    2. At most PENDING_CHUNKS chunks for every worker are waiting at a time: the next chunk is read only
+    after the results of the oldest one were generated, so a big input is never read all at once.
+    3. If there are less than PARALLEL_JOBS jobs (or a single worker), they are performed in the current
+    process, since starting the workers would take longer.
+    :param jobs: The jobs (any iterable of lines)
+    :param workers: The number of worker processes (by default, the number of cores)
+    :param chunk_chars: The number of characters of the jobs sent to a worker at once
+    :return: A generator of the lines of the results
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = iter(jobs)
+    first = list(islice(jobs, PARALLEL_JOBS))
+    if workers == 1 or len(first) < PARALLEL_JOBS:
+        yield from run_chunk(first)
+        yield from map(job_result, jobs)
+        return
+    pending = deque()
+    with ProcessPoolExecutor(workers) as pool:
+        for chunk in chunks(chain(first, jobs), chunk_chars):
+            pending.append(pool.submit(run_chunk, chunk))
+            if len(pending) >= workers * PENDING_CHUNKS:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
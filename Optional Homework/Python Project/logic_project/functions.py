@@ -0,0 +1,311 @@
+"""
+This module contains auxiliary functions used in the whole app.
+"""
+
+from .power_cache import CACHE
+from .power_cache import power
+from .codec import get_codec
+
+# The digits of base 16 (as an auxiliary tool for validating the numbers in base 16)
+DIGITS_16 = ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'A', 'B', 'C', 'D', 'E', 'F')
+
+
+def value(digit):
+    """
+    This function computes and returns the value of a digit (from a character to an integer).
+    The digit is sure to be a correct one.
+    :param digit: A character corresponding a digit in a certain base
+    :return: The numeric value of the digit
+    """
+    if digit.isdigit():
+        return ord(digit) - ord('0')
+    else:
+        return ord(digit) - ord('A') + 10 # If it's not a digit, then it sure is a digit in base 16
+
+
+def char(digit):
+    """
+    This function computes and returns the character of a digit (from a value to a character).
+    The digit is sure to be a correct one.
+    :param digit: A value corresponding to a digit in a certain base
+    :return: The character of the digit
+    """
+    if digit < 10:
+        return chr(digit + ord('0'))
+    else:
+        return chr(digit + ord('A') - 10) # If it exceeds 9, then it sure is in base 16
+
+
+def valid_base(p):
+    """
+    This functions verifies and returns if a base is valid.
+    For this, the base must be one of: {2,3,4,5,6,7,8,9,16}
+    :param p: The base
+    :return: True if the base is valid, False otherwise
+    """
+    try:
+        p = int(p)
+    except ValueError:
+        return False
+    if p < 2: return False
+    if 10 < p < 16: return False
+    if p > 16: return False
+    return True
+
+
+def valid_number(p, number, digits_16):
+    """
+    This functions verifies and returns if a number in a certain base is valid.
+    For this, it must be formed only with digits and those digits must be within the bound of the base
+    (the uppercase digits of the codec of the base, see codec.Codec, which verifies the whole number at once).
+    :param p: The base of the number
+    :param number: The number
+    :param digits_16: The digits of base 16 (not needed anymore, kept for the existing callers)
+    :return: True if the number is valid, False otherwise
+    """
+    return get_codec(p, ignore_case=False).valid(number)
+
+
+def greater_number(n1, n2):
+    """
+    This function verifies and returns which number is greater between two numbers [n1] and [n2].
+    The number with the most digits is the bigger one.
+    In case of equality, the digits are compared one by one from left to right until one is bigger
+    (for strings, this is the comparison of the strings, since the digits are ordered as their characters;
+    for BaseNumbers, the limbs are compared instead of the digits).
+    In case still of equality, the numbers are equal (but since we need one to be bigger, we will consider
+    the first one to be that one).
+    :param n1: The first number (a string or a BaseNumber)
+    :param n2: The second number (of the same type)
+    :return: 1 if the first number is bigger or equal than the second one, 2 otherwise
+    """
+    if len(n1) > len(n2):
+        return 1
+    if len(n2) > len(n1):
+        return 2
+    if n1 >= n2:
+        return 1
+    return 2
+
+
+def remove_leading_zeros(number):
+    """
+    This functions removes the leading zeros of a number.
+    The number is given as a string.
+    For this, all the leading zeros are stripped at once (slicing them one by one would copy the string
+    for every zero). If the number is zero, the last zero is kept (since we need to have at least a digit
+    in the number).
+    :param number: The number (in string format)
+    :return: The number without any leading zeros (in string format)
+    """
+    return number.lstrip('0') or number[-1:]
+
+
+def digits_of(number):
+    """
+    This function returns a number given as a string or as a buffer (bytes, bytearray or memoryview) in a form
+    that the operations and the conversions accept (they slice it and parse the pieces with int):
+    strings, bytes and bytearrays are used as they are, and a memoryview is replaced by the object it views
+    (when it views all of it), so the digits are not copied.
+    :param number: The number
+    :return: The number (a string, bytes or a bytearray)
+    """
+    if isinstance(number, memoryview):
+        if isinstance(number.obj, (bytes, bytearray)) and number.nbytes == len(number.obj):
+            return number.obj
+        return number.tobytes()  # Only a part of a buffer is viewed, so that part is copied
+    return number
+
+
+def write_output(result, out):
+    """
+    This function returns the result of an operation or of a conversion: as a string, or written into
+    a buffer [out], if one is given.
+    :param result: The result (a string or a buffer)
+    :param out: The buffer (a bytearray, whose contents are replaced), or None
+    :return: The result (in string format), or the buffer
+    """
+    if out is None:
+        return result if isinstance(result, str) else result.decode("ascii")
+    out[:] = result.encode("ascii") if isinstance(result, str) else result
+    return out
+
+
+# The size (in digits) of the pieces that the divide-and-conquer conversions handle directly
+SPLIT_DIGITS = 64
+# Below this size (in bits), the built-in integer division is fast enough for a reciprocal
+RECIPROCAL_BITS = 4096
+# The format specifications of the bases that have a built-in format
+FORMATS = {2: "b", 8: "o", 10: "d", 16: "X"}
+
+
+def digit_groups(p, size):
+    """
+    This function creates the table of all the numbers with [size] digits in a base [p] (with leading zeros),
+    so that the integer [i] is written as the element with the index [i].
+    :param p: The base of the numbers
+    :param size: The number of digits of every number
+    :return: A list with all the [size]-digit numbers in base [p] (in string format)
+    """
+    groups = [""]
+    for i in range(size):
+        groups = [group + char(digit) for group in groups for digit in range(p)]
+    return groups
+
+
+def reciprocal(d, k):
+    """
+    This function computes and returns the integer part of 2^k / d, using Newton's iteration.
+    For small numbers, the built-in division is used directly. For big numbers:
+    1. We compute the reciprocal of the truncated divisor with half of the precision (recursively).
+    2. One Newton step (y + y * (2^k - d * y) / 2^k) doubles the number of correct bits.
+    3. The few units of error left are corrected by comparing with [d].
+    This way, the reciprocal costs about as much as a few multiplications.
+    :param d: The divisor (a positive integer)
+    :param k: The precision, in bits
+    :return: The integer part of 2^k / d
+    """
+    n = d.bit_length()
+    shift = (k - n) // 2 - 32  # How many bits of the divisor we drop for the half-precision step
+    if k - n <= RECIPROCAL_BITS or shift <= 0 or n - shift < 64:
+        return (1 << k) // d
+    y = reciprocal(d >> shift, k - 2 * shift) << shift
+    y += y * ((1 << k) - d * y) >> k  # The Newton step
+    error = (1 << k) - d * y  # The exact error, so that the result is corrected to the integer part
+    while error < 0:
+        y -= 1
+        error += d
+    while error >= d:
+        y += 1
+        error -= d
+    return y
+
+
+def fast_divmod(x, d, inverse, k):
+    """
+    This function computes and returns the quotient and the remainder of the division between [x] and [d],
+    using a precomputed reciprocal of [d] (the integer part of 2^k / d), so that the division
+    costs about as much as two multiplications.
+    :param x: The dividend (it must be smaller than 2^k)
+    :param d: The divisor
+    :param inverse: The integer part of 2^k / d
+    :param k: The precision of the reciprocal, in bits
+    :return: The quotient and the remainder
+    """
+    q = (x * inverse) >> k  # The quotient is at most a few units too small
+    r = x - q * d
+    while r >= d:
+        q += 1
+        r -= d
+    return q, r
+
+
+def to_integer(b, n):
+    """
+    This function converts a number [n] from a base [b] into an integer, with a divide-and-conquer method.
+    The number is split in two: the lower half has SPLIT_DIGITS * 2^j digits (the biggest such power below
+    the length of the number), so that n = high * b^(SPLIT_DIGITS * 2^j) + low.
+    The powers are computed once (by squaring, and kept in the power cache) and used for all the splits on the
+    same level, and the halves are converted in the same way (small pieces are converted directly).
+    :param b: The base of the number (from 2 to 36)
+    :param n: The number (a string, bytes or a bytearray)
+    :return: The value of the number
+    """
+    if len(n) <= SPLIT_DIGITS or b & (b - 1) == 0:  # For powers of 2, the built-in conversion is linear
+        return int(n, b)
+    powers = [power(b, SPLIT_DIGITS)]  # powers[j] is b^(SPLIT_DIGITS * 2^j)
+    while SPLIT_DIGITS << len(powers) < len(n):
+        powers.append(power(b, SPLIT_DIGITS << len(powers)))
+
+    def convert(start, stop, level):
+        while level >= 0 and SPLIT_DIGITS << level >= stop - start:
+            level -= 1  # We find the biggest power that splits the current piece
+        if level < 0:
+            return int(n[start:stop], b)
+        middle = stop - (SPLIT_DIGITS << level)
+        return convert(start, middle, level - 1) * powers[level] + convert(middle, stop, level - 1)
+
+    return convert(0, len(n), len(powers) - 1)
+
+
+def from_integer(h, x):
+    """
+    This function converts an integer [x] into a number in base [h] (see integer_pieces).
+    :param h: The destination base (from 2 to 36)
+    :param x: The integer (not negative)
+    :return: The number in base [h] (in string format)
+    """
+    return "".join(integer_pieces(h, x))
+
+
+def write_integer(h, x, out):
+    """
+    This function converts an integer [x] into a number in base [h] (see integer_pieces), written into a buffer:
+    the pieces are added to the buffer as they are generated, so the whole number is never kept as a string.
+    :param h: The destination base (from 2 to 36)
+    :param x: The integer (not negative)
+    :param out: The buffer (a bytearray, whose contents are replaced)
+    :return: The buffer
+    """
+    del out[:]
+    for piece in integer_pieces(h, x):
+        out += piece.encode("ascii")
+    return out
+
+
+def integer_pieces(h, x):
+    """
+    This function converts an integer [x] into a number in base [h], with a divide-and-conquer method, and
+    generates the digits piece by piece (from left to right), so that the whole number doesn't need to be kept.
+    The integer is split by a power h^(SPLIT_DIGITS * 2^j), so that the quotient gives the first digits
+    and the remainder gives the last SPLIT_DIGITS * 2^j digits (with leading zeros).
+    The powers (and their reciprocals, so that the divisions are fast) are computed once, and kept
+    in the power cache.
+    The small pieces are written with a table of digit groups (or with the built-in format, if the base has one).
+    For the bases 2, 8 and 16, the built-in format is linear, so it is used for the whole number.
+    :param h: The destination base (from 2 to 36)
+    :param x: The integer (not negative)
+    :return: A generator of the pieces of the number in base [h] (in string format)
+    """
+    if h in FORMATS and h != 10:
+        yield format(x, FORMATS[h])
+        return
+    if x == 0:
+        yield "0"
+        return
+    size = 1  # The size of the digit groups, so that the table has at most 4096 elements
+    while h ** (size + 1) <= 4096:
+        size += 1
+    groups = CACHE.lookup(("groups", h, size), lambda: digit_groups(h, size))
+    group_power = h ** size
+    powers = [power(h, SPLIT_DIGITS)]  # powers[j] is h^(SPLIT_DIGITS * 2^j)
+    while powers[-1] * powers[-1] <= x:
+        powers.append(power(h, SPLIT_DIGITS << len(powers)))
+
+    def convert(y, level, pad):
+        if not pad and y == 0:
+            return  # A zero without leading zeros has no digits
+        if level < 0 and h == 10:
+            yield str(y).zfill(SPLIT_DIGITS) if pad else str(y)
+            return
+        if level < 0:
+            digits = []
+            for i in range(0, SPLIT_DIGITS, size):
+                y, group = divmod(y, group_power)
+                digits.append(groups[group])
+                if not pad and y == 0:
+                    break
+            piece = "".join(reversed(digits))
+            yield piece[-SPLIT_DIGITS:] if pad else piece.lstrip("0")
+            return
+        d = powers[level]
+        if not pad and y < d:
+            yield from convert(y, level - 1, False)  # The first digits are all on the lower levels
+            return
+        k = 2 * d.bit_length()
+        inverse = CACHE.lookup(("reciprocal", h, SPLIT_DIGITS << level), lambda: reciprocal(d, k))
+        q, r = fast_divmod(y, d, inverse, k)
+        yield from convert(q, level - 1, pad)
+        yield from convert(r, level - 1, True)
+
+    yield from convert(x, len(powers) - 1, False)
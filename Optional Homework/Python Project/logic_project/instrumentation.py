@@ -0,0 +1,170 @@
+"""
+This module contains the instrumentation of the app, functions that measure the operations and the conversions
+while they run: for every public function of operations.py and conversions.py, the number of calls, the total time,
+the number of digits processed (of its string and buffer arguments) and, optionally, the memory allocated;
+the calls of the digit functions (value and char) are counted too.
+The instrumentation is opt-in and costs nothing when disabled: enable replaces the functions in the modules with
+measuring ones, and disable puts the original functions back.
+A hook (for example, a metrics exporter) can be called after every measured call.
+The references taken before enabling (like the tables of batch.py) still call the original functions.
+"""
+
+import time
+import tracemalloc
+from functools import wraps
+from inspect import isfunction
+
+from . import functions
+from . import operations
+from . import conversions
+
+# The modules whose public functions are measured
+MODULES = (operations, conversions)
+# The digit functions, whose calls are only counted (measuring them would cost more than the calls)
+DIGIT_FUNCTIONS = ("value", "char")
+# The modules where the functions are replaced (every module that uses them)
+NAMESPACES = (functions, operations, conversions)
+
+statistics = {}  # The statistics of every function, by its name ("module.function")
+originals = {}  # The original functions, by the modules and the names they were replaced at
+hook = None  # The function called after every measured call (or None)
+tracing = False  # True if tracemalloc was started by the instrumentation
+
+
+def new_record():
+    """
+    :return: The statistics of a function that wasn't called yet
+    """
+    return {"calls": 0, "seconds": 0.0, "digits": 0, "allocated_bytes": 0}
+
+
+def measured(name, function):
+    """
+    This function creates and returns a function that calls a function and adds the call to its statistics:
+    the time (including the calls it makes), the digits of its string and buffer arguments and the memory it
+    allocated (if tracemalloc is tracing), and then calls the hook.
+    :param name: The name of the function
+    :param function: The function
+    :return: The measuring function
+    """
+    record = statistics.setdefault(name, new_record())
+
+    @wraps(function)
+    def call(*args, **kwargs):
+        digits = sum(len(arg) for arg in args if isinstance(arg, (str, bytes, bytearray, memoryview)))
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            record["calls"] += 1
+            record["seconds"] += elapsed
+            record["digits"] += digits
+            if memory is not None:
+                record["allocated_bytes"] += max(tracemalloc.get_traced_memory()[0] - memory, 0)
+            if hook is not None:
+                hook(name, elapsed, digits)
+
+    return call
+
+
+def counted(name, function):
+    """
+    This function creates and returns a function that calls a function and only counts the call.
+    :param name: The name of the function
+    :param function: The function
+    :return: The counting function
+    """
+    record = statistics.setdefault(name, new_record())
+
+    @wraps(function)
+    def call(*args):
+        record["calls"] += 1
+        return function(*args)
+
+    return call
+
+
+def public_functions(module):
+    """
+    This function returns the public functions defined in a module (not the imported ones).
+    :param module: The module
+    :return: The dictionary of the functions, by their names
+    """
+    return {name: function for name, function in vars(module).items()
+            if isfunction(function) and function.__module__ == module.__name__ and not name.startswith("_")}
+
+
+def enable(callback=None, allocations=False):
+    """
+    This function enables the instrumentation: every public function of MODULES (and every digit function) is
+    replaced, in every module of NAMESPACES, by a function that measures it.
+    :param callback: The hook, called as callback(name, seconds, digits) after every measured call
+    :param allocations: True if the memory allocated by the functions is measured too (with tracemalloc,
+    which slows down the app)
+    """
+    global hook, tracing
+    disable()
+    hook = callback
+    replacements = {}  # The measuring functions, by the id of the original functions
+    for module in MODULES:
+        for name, function in public_functions(module).items():
+            replacements[id(function)] = measured("%s.%s" % (module.__name__.rpartition(".")[2], name), function)
+    for name in DIGIT_FUNCTIONS:
+        function = getattr(functions, name)
+        replacements[id(function)] = counted("functions.%s" % name, function)
+    for module in NAMESPACES:
+        for name, function in list(vars(module).items()):
+            if isfunction(function) and id(function) in replacements:
+                originals[module, name] = function
+                setattr(module, name, replacements[id(function)])
+    if allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        tracing = True
+
+
+def disable():
+    """
+    This function disables the instrumentation, putting the original functions back (the statistics are kept).
+    """
+    global hook, tracing
+    for (module, name), function in originals.items():
+        setattr(module, name, function)
+    originals.clear()
+    hook = None
+    if tracing:
+        tracemalloc.stop()
+        tracing = False
+
+
+def enabled():
+    """
+    :return: True if the instrumentation is enabled, False otherwise
+    """
+    return bool(originals)
+
+
+def reset():
+    """
+    This function resets the statistics of all the functions.
+    """
+    for record in statistics.values():
+        record.update(new_record())
+
+
+def report():
+    """
+    :return: The statistics of the functions that were called, by their names (a copy)
+    """
+    return {name: dict(record) for name, record in statistics.items() if record["calls"]}
+
+
+def print_report():
+    """
+    This function prints the statistics of the functions that were called, as a table (the slowest first).
+    """
+    print("%-40s %10s %12s %12s %16s" % ("function", "calls", "time (ms)", "digits", "allocated bytes"))
+    for name, record in sorted(report().items(), key=lambda item: -item[1]["seconds"]):
+        print("%-40s %10d %12.3f %12d %16d" % (name, record["calls"], record["seconds"] * 1000,
+                                                record["digits"], record["allocated_bytes"]))
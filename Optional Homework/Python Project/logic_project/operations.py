@@ -0,0 +1,647 @@
+"""
+This module contains the operations parts, functions that do arithmetic operations in a certain
+base with positive integers.
+The numbers can be given as strings or as buffers (bytes, bytearray or memoryview, with the ASCII digits).
+The results are strings, or, if a buffer [out] (a bytearray) is given, they are written into it.
+The steps of an operation are given to its [trace] (see steps.py), if one is given.
+"""
+
+from .functions import value
+from .functions import greater_number
+from .functions import remove_leading_zeros
+from .functions import to_integer
+from .functions import from_integer
+from .functions import reciprocal
+from .functions import fast_divmod
+from .functions import digits_of
+from .functions import write_output
+from .functions import write_integer
+from .codec import get_codec
+from .base_number import BaseNumber
+from .base_number import limb_digits
+from array import array
+from itertools import islice
+from itertools import zip_longest
+
+# Below this number of limbs, the multiplication is done as in school (every limb with every limb)
+KARATSUBA_LIMBS = 24
+# From this number of limbs, the multiplication uses Toom-3 instead of Karatsuba
+TOOM3_LIMBS = 100
+# From this size of the divisor (in bits), the division uses a Newton reciprocal instead of long division
+NEWTON_DIVISION_BITS = 160000
+
+
+def addition(p, n1, n2, out=None, trace=None):
+    """
+    This functions performs the addition between two positive integers [n1] and [n2]
+    in a certain base [p], and returns the result.
+    For this, the addition is performed from right to left:
+    1. The two digits are added together (the digit for a number with no more digits is considered zero),
+    and also add the carry (if it exists) from the previous addition.
+    2. The modulo base [p] is kept as the digit for that position, and we also take into account
+    the carry for the next digit addition.
+    The numbers are stored as BaseNumbers, so the addition is done on whole limbs (groups of digits) instead
+    of single digits, and the strings are only parsed and created at the beginning and at the end.
+    :param p: The base of the numbers
+    :param n1: The first number
+    :param n2: The second number
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result from adding the two numbers
+    """
+    n1, n2 = digits_of(n1), digits_of(n2)
+    a, b = BaseNumber.from_string(p, n1), BaseNumber.from_string(p, n2)
+    result = a + b
+    if trace is not None:
+        trace("limbs", base=p, digits=limb_digits(p), n1=tuple(reversed(a.limbs)), n2=tuple(reversed(b.limbs)),
+              result=tuple(reversed(result.limbs)))
+    if out is not None:
+        return result.write(out, max(len(n1), len(n2)))
+    return result.to_string(max(len(n1), len(n2)))  # The leading zeros of the numbers are kept
+
+
+def subtraction(p, n1, n2, out=None, trace=None):
+    """
+    This function performs the subtraction between two numbers [n1] and [n2] in a certain base [p],
+    and returns the result.
+    For this, we perform the subtraction that is easier to do, subtracting the smaller number
+    from the bigger number. If the order is reversed, we add a minus sign at the result.
+    The subtraction is performed from right to left:
+    1. The digits are subtracted one from the other (if the second number has no more digits,
+    we consider it to be zero), and also subtract the carry (if it exists) from the previous subtraction.
+    2. If it is positive, we have our current digit. If not, we add the base (being a carry from the
+    next subtraction) and now we have our digit (the negative number cannot exceed the base, so after
+    adding the base we are sure to have something not negative).
+    As for the addition, the subtraction is done on the limbs of BaseNumbers.
+    :param p: The base of the numbers
+    :param n1: The first number
+    :param n2: The second number
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result of the subtraction
+    """
+    neg = 0
+    n1, n2 = BaseNumber.from_string(p, digits_of(n1)), BaseNumber.from_string(p, digits_of(n2))
+    if greater_number(n1, n2) == 2:  # If the second number is bigger, we swap them
+        n1, n2 = n2, n1
+        neg = 1  # The final result will be negative
+    if trace is not None:
+        trace("limbs", base=p, digits=limb_digits(p), n1=tuple(reversed(n1.limbs)), n2=tuple(reversed(n2.limbs)),
+              result=tuple(reversed((n1 - n2).limbs)), negative=bool(neg))
+    if out is not None:
+        (n1 - n2).write(out)
+        if neg:
+            out[:0] = b"-"
+        return out
+    result = (n1 - n2).to_string()
+    if neg:
+        result = "-" + result
+    return result
+
+
+def stream_addition(p, digits1, digits2):
+    """
+    This function performs the addition between two numbers given as streams of digits (characters), from
+    right to left (the last digit first), in a certain base [p], and generates the digits of the result
+    in the same order, one at a time, as soon as their carry is known.
+    The addition is done as in addition (a shorter number has zeros as its next digits), but the numbers are
+    never kept, so two numbers of any length (for example, read from the end of two files) are added in
+    constant memory. The result has as many digits as the longest number (and one more for a last carry).
+    :param p: The base of the numbers
+    :param digits1: The digits of the first number (an iterable, from right to left)
+    :param digits2: The digits of the second number
+    :return: The generator of the digits of the result (from right to left)
+    """
+    codec = get_codec(p)
+    decoding, alphabet = codec.decoding, codec.alphabet
+    carry = 0
+    for digit1, digit2 in zip_longest(digits1, digits2, fillvalue='0'):
+        value1, value2 = decoding[ord(digit1)], decoding[ord(digit2)]
+        if value1 >= p or value2 >= p:
+            raise ValueError("The numbers are not valid in base %d." % p)
+        carry, digit = divmod(value1 + value2 + carry, p)
+        yield alphabet[digit]
+    if carry:
+        yield alphabet[carry]  # We may still have a carry at the end, which we add to the result
+
+
+def stream_subtraction(p, digits1, digits2):
+    """
+    This function performs the subtraction between two numbers given as streams of digits (characters), from
+    right to left (the last digit first), in a certain base [p], and generates the digits of the result
+    in the same order, one at a time, in constant memory.
+    The subtraction is done in a single pass, without comparing the numbers first: the borrow of every digit
+    is passed to the next one, and only the last borrow tells the sign of the result. If it is set, the first
+    number was smaller, and the digits generated are the complement of the result (p^L minus the result, where
+    L is the number of digits), so a minus sign is generated at the end (see complement_digits for getting
+    the digits of the result back from the complement, in a second pass).
+    The result has as many digits as the longest number.
+    :param p: The base of the numbers
+    :param digits1: The digits of the first number (an iterable, from right to left)
+    :param digits2: The digits of the second number
+    :return: The generator of the digits of the result (from right to left), followed by '-' if it is negative
+    """
+    codec = get_codec(p)
+    decoding, alphabet = codec.decoding, codec.alphabet
+    borrow = 0
+    for digit1, digit2 in zip_longest(digits1, digits2, fillvalue='0'):
+        value1, value2 = decoding[ord(digit1)], decoding[ord(digit2)]
+        if value1 >= p or value2 >= p:
+            raise ValueError("The numbers are not valid in base %d." % p)
+        digit = value1 - value2 - borrow
+        borrow = 1 if digit < 0 else 0
+        yield alphabet[digit + borrow * p]  # If it's negative, we add the base (a borrow from the next digit)
+    if borrow:
+        yield '-'
+
+
+def complement_digits(p, digits):
+    """
+    This function generates the digits of p^L minus a number of L digits given as a stream of digits
+    (from right to left), in the same order: the last zeros stay zeros, the first digit that is not zero
+    becomes [p] minus the digit, and all the others become p - 1 minus the digit.
+    For the complement generated by stream_subtraction, this gives the digits of the (negative) result.
+    :param p: The base of the number
+    :param digits: The digits of the number (an iterable, from right to left, without the sign)
+    :return: The generator of the digits of the complement (from right to left)
+    """
+    codec = get_codec(p)
+    decoding, alphabet = codec.decoding, codec.alphabet
+    subtrahend = p  # The first digit that is not zero is subtracted from [p], the next ones from p - 1
+    for digit in digits:
+        digit = decoding[ord(digit)]
+        if digit >= p:
+            raise ValueError("The number is not valid in base %d." % p)
+        if digit == 0 and subtrahend == p:
+            yield alphabet[0]
+        else:
+            yield alphabet[subtrahend - digit]
+            subtrahend = p - 1
+
+
+def multiplication(p, n, d, out=None, trace=None):
+    """
+    This function performs the multiplication between a number [n] and a digit [d] in a certain base
+    [p], and return the result.
+    For this, the number is parsed from right to left:
+    1. We perform the multiplication between the digit of the number [n], and our digit [d], also adding
+    (if it exists) a carry from the last multiplication.
+    2. If the number has one digit in base [p], that will be our current digit.
+    If not, the second digit will be the current one, and the first one will be kept as a carry
+    (the partial result cannot exceed two digits in base [p]).
+    :param p: The base of the numbers
+    :param n: The number (one of the factors)
+    :param d: The digit (one of the factors)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result of the multiplication
+    """
+    codec = get_codec(p)
+    factor = value(digits_of(d))
+    digits = codec.decode(n, False)
+    result = bytearray(len(digits) + 1)  # The values of the digits of the result, filled from right to left
+    position = len(result)
+    carry = 0
+    for digit in reversed(digits):
+        partial_result = factor * digit + carry
+        position -= 1
+        result[position] = partial_result % p
+        carry = partial_result // p  # The first digit of the partial result in base [p] (which can also be zero)
+    if carry:
+        result[0] = carry  # We may still have a carry at the end, which we add to the result
+    else:
+        del result[0]
+    result = result.translate(codec.encoding)
+    if trace is not None:
+        trace("product", base=p, number=n, digit=d, result=result)
+    return write_output(result, out)
+
+
+def add_limbs(a, b):
+    """
+    This function adds two lists of limbs, position by position (without carries).
+    :param a: The first list of limbs (from right to left)
+    :param b: The second list of limbs
+    :return: The list of the sums
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i in range(len(b)):
+        result[i] += b[i]
+    return result
+
+
+def subtract_limbs(a, b):
+    """
+    This function subtracts two lists of limbs, position by position (without borrows, so the limbs
+    may become negative).
+    :param a: The first list of limbs (from right to left)
+    :param b: The second list of limbs
+    :return: The list of the differences
+    """
+    result = list(a) + [0] * (len(b) - len(a))
+    for i in range(len(b)):
+        result[i] -= b[i]
+    return result
+
+
+def schoolbook(a, b):
+    """
+    This function multiplies two lists of limbs as in school: every limb of the first number is multiplied
+    with every limb of the second one, and the product is added on the position given by the sum of
+    their positions. The carries are not propagated (the limbs of the result may be big).
+    :param a: The first list of limbs (from right to left)
+    :param b: The second list of limbs
+    :return: The list of limbs of the product
+    """
+    result = [0] * (len(a) + len(b) - 1)
+    for i in range(len(a)):
+        x = a[i]
+        if x:
+            for j in range(len(b)):
+                result[i + j] += x * b[j]
+    return result
+
+
+def karatsuba(a, b):
+    """
+    This function multiplies two lists of limbs with Karatsuba's method.
+    The numbers are split in two: a = a1 * X + a0 and b = b1 * X + b0 (where X is p^k to the power [m]).
+    The product is a1 * b1 * X^2 + (a0 + a1) * (b0 + b1) - a0 * b0 - a1 * b1) * X + a0 * b0, so only three
+    products of half the size are needed (instead of four).
+    :param a: The first list of limbs (from right to left)
+    :param b: The second list of limbs
+    :return: The list of limbs of the product (the carries are not propagated)
+    """
+    m = (max(len(a), len(b)) + 1) // 2
+    a0, a1, b0, b1 = a[:m], a[m:], b[:m], b[m:]
+    z0 = multiply_limbs(a0, b0)
+    z2 = multiply_limbs(a1, b1)
+    z1 = subtract_limbs(subtract_limbs(multiply_limbs(add_limbs(a0, a1), add_limbs(b0, b1)), z0), z2)
+    result = [0] * (len(a) + len(b) - 1)
+    for shift, z in ((0, z0), (m, z1), (2 * m, z2)):
+        for i in range(len(z)):
+            result[shift + i] += z[i]
+    return result
+
+
+def toom3(a, b):
+    """
+    This function multiplies two lists of limbs with the Toom-3 method.
+    The numbers are split in three: a = a2 * X^2 + a1 * X + a0 (and the same for b), so they are seen as
+    polynomials of degree 2. The product is a polynomial of degree 4, which is found from its values in the
+    points 0, 1, -1, -2 and infinity (5 products of a third of the size, instead of 9), by interpolation.
+    All the divisions of the interpolation are exact.
+    :param a: The first list of limbs (from right to left)
+    :param b: The second list of limbs
+    :return: The list of limbs of the product (the carries are not propagated)
+    """
+    m = (max(len(a), len(b)) + 2) // 3
+    values = []
+    for x in (a, b):
+        x0, x1, x2 = x[:m], x[m:2 * m], x[2 * m:]
+        x02 = add_limbs(x0, x2)
+        xm1 = subtract_limbs(x02, x1)  # The value in -1
+        xm2 = subtract_limbs([2 * limb for limb in add_limbs(xm1, x2)], x0)  # The value in -2
+        values.append((x0, add_limbs(x02, x1), xm1, xm2, x2))
+    r0, r1, rm1, rm2, rinf = [multiply_limbs(x, y) for x, y in zip(values[0], values[1])]
+    r3 = [limb // 3 for limb in subtract_limbs(rm2, r1)]
+    r1 = [limb // 2 for limb in subtract_limbs(r1, rm1)]
+    r2 = subtract_limbs(rm1, r0)
+    r3 = add_limbs([limb // 2 for limb in subtract_limbs(r2, r3)], [2 * limb for limb in rinf])
+    r2 = subtract_limbs(add_limbs(r2, r1), rinf)
+    r1 = subtract_limbs(r1, r3)
+    result = [0] * (len(a) + len(b) - 1)
+    for shift, z in ((0, r0), (m, r1), (2 * m, r2), (3 * m, r3), (4 * m, rinf)):
+        # For unbalanced numbers, r1 and r3 can be longer than the product (their extra limbs are zero),
+        # so they are cut to the length of the result
+        for i in range(min(len(z), len(result) - shift)):
+            result[shift + i] += z[i]
+    return result
+
+
+def multiply_limbs(a, b):
+    """
+    This function multiplies two lists of limbs, choosing the method by the size of the numbers:
+    as in school for small numbers, Karatsuba from KARATSUBA_LIMBS limbs, and Toom-3 from TOOM3_LIMBS limbs.
+    If a number is much shorter than the other one, the longer one is cut in pieces of the same size
+    as the shorter one, which are multiplied separately.
+    :param a: The first list of limbs (from right to left)
+    :param b: The second list of limbs
+    :return: The list of limbs of the product (the carries are not propagated)
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return []
+    if len(b) < KARATSUBA_LIMBS:
+        return schoolbook(a, b)
+    if 2 * len(b) <= len(a):
+        result = [0] * (len(a) + len(b) - 1)
+        for shift in range(0, len(a), len(b)):
+            z = multiply_limbs(a[shift:shift + len(b)], b)
+            for i in range(len(z)):
+                result[shift + i] += z[i]
+        return result
+    if len(b) < TOOM3_LIMBS:
+        return karatsuba(a, b)
+    return toom3(a, b)
+
+
+def multiply(p, n1, n2, out=None, trace=None):
+    """
+    This function performs the multiplication between two numbers [n1] and [n2] in a certain base [p],
+    and returns the result.
+    The numbers are stored in limbs (as BaseNumbers), which are multiplied as the coefficients of two
+    polynomials (see multiply_limbs). At the end, the carries are propagated from right to left:
+    every limb of the product is kept modulo p^k, and the rest is carried to the next limb.
+    :param p: The base of the numbers
+    :param n1: The first number
+    :param n2: The second number
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result of the multiplication
+    """
+    a = BaseNumber.from_string(p, digits_of(n1)).limbs.tolist()
+    b = BaseNumber.from_string(p, digits_of(n2)).limbs.tolist()
+    if trace is not None:
+        shorter = min(len(a), len(b))
+        method = "schoolbook" if shorter < KARATSUBA_LIMBS else "karatsuba" if shorter < TOOM3_LIMBS else "toom3"
+        trace("limbs", base=p, digits=limb_digits(p), n1=len(a), n2=len(b), method=method)
+    limbs = propagate_carries(p, multiply_limbs(a, b))
+    if trace is not None:
+        trace("carries", limbs=len(limbs))
+    if out is not None:
+        return BaseNumber(p, limbs).write(out)
+    return BaseNumber(p, limbs).to_string()
+
+
+def propagate_carries(p, columns):
+    """
+    This function propagates the carries of a list of limbs that can be bigger than a limb (the sums of the
+    columns, or the coefficients of a product), from right to left: every limb is kept modulo p^k, and the rest
+    is carried to the next limb.
+    :param p: The base of the numbers
+    :param columns: The list of limbs (from right to left)
+    :return: The limbs (an array, from right to left, without leading zero limbs)
+    """
+    limit = p ** limb_digits(p)
+    limbs = array("Q")
+    carry = 0
+    for limb in columns:
+        carry, limb = divmod(limb + carry, limit)
+        limbs.append(limb)
+    while carry:
+        carry, limb = divmod(carry, limit)
+        limbs.append(limb)
+    while len(limbs) > 1 and limbs[-1] == 0:
+        limbs.pop()
+    return limbs
+
+
+def sum_many(p, numbers, out=None, trace=None):
+    """
+    This function performs the addition of many numbers in a certain base [p], and returns the result.
+    Instead of adding the numbers two by two (and copying the growing result every time), the limbs of all the
+    numbers are added column by column in a single pass, without carries: a column can hold the sum of many limbs.
+    The carries are propagated only once, at the end (see propagate_carries).
+    :param p: The base of the numbers
+    :param numbers: The numbers (any iterable of numbers)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result from adding all the numbers
+    """
+    columns = []  # The sums of the limbs of every position (from right to left)
+    count = 0
+    for n in numbers:
+        limbs = BaseNumber.from_string(p, digits_of(n)).limbs
+        if len(limbs) > len(columns):
+            columns.extend([0] * (len(limbs) - len(columns)))
+        for i, limb in enumerate(limbs):
+            columns[i] += limb
+        count += 1
+    if trace is not None:
+        trace("columns", base=p, digits=limb_digits(p), numbers=count, limbs=len(columns))
+    result = BaseNumber(p, propagate_carries(p, columns or [0]))
+    if out is not None:
+        return result.write(out)
+    return result.to_string()
+
+
+def product_many(p, numbers, out=None, trace=None):
+    """
+    This function performs the multiplication of many numbers in a certain base [p], and returns the result.
+    The numbers are multiplied as a balanced product tree: they are multiplied two by two, then the products
+    two by two, and so on, so that the numbers multiplied together always have about the same size
+    (see multiply_limbs), instead of multiplying a growing product by every small number.
+    :param p: The base of the numbers
+    :param numbers: The numbers (any iterable of numbers)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result of the multiplication of all the numbers
+    """
+    level = [BaseNumber.from_string(p, digits_of(n)).limbs for n in numbers]
+    if not level:
+        level = [array("Q", [1])]  # The product of no numbers is 1
+    elif any(len(limbs) == 1 and limbs[0] == 0 for limbs in level):
+        level = [array("Q", [0])]
+    while len(level) > 1:
+        if trace is not None:
+            trace("level", base=p, products=len(level), limbs=sum(len(limbs) for limbs in level))
+        products = [propagate_carries(p, multiply_limbs(level[i].tolist(), level[i + 1].tolist()))
+                    for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            products.append(level[-1])  # The last number is multiplied at the next level
+        level = products
+    result = BaseNumber(p, level[0])
+    if out is not None:
+        return result.write(out)
+    return result.to_string()
+
+
+def integer_division(p, n, divisor):
+    """
+    This function performs the integer part of the division between a number [n] and a digit, in a base [p],
+    and returns the quotient and the remainder.
+    For this, the number is parsed from left to right, as in a manual division: the current digit of the result
+    is the quotient of the current dividend and the digit, and the next dividend is the modulo, multiplied
+    by the base, plus the next digit of the number ("lowered").
+    :param p: The base of the numbers
+    :param n: The number (dividend)
+    :param divisor: The value of the digit (divisor)
+    :return: The quotient (in string format, without leading zeros) and the remainder (an integer)
+    """
+    codec = get_codec(p)
+    result = bytearray()  # The values of the digits of the result (decoded and encoded by the codec of the base)
+    dividend = 0
+    for digit in codec.decode(n, False):
+        dividend = dividend * p + digit  # The value of the dividend is kept in base 10
+        result.append(dividend // divisor)  # By the division rules, we will always have a valid
+        # digit - the base doesn't matter since it won't exceed the base [p]
+        dividend %= divisor
+    return remove_leading_zeros(codec.encode(result)), dividend
+
+
+def fraction_digits(p, remainder, divisor):
+    """
+    This function generates the fractional digits of the division between a remainder and a digit, in a base [p],
+    one at a time (only when they are needed), by lowering zeros: the remainder is multiplied by the base,
+    and the digit is the quotient of the remainder and the divisor.
+    The generation stops when the remainder becomes zero (so it never stops if the fractional part is periodic).
+    :param p: The base of the numbers
+    :param remainder: The remainder (smaller than the divisor)
+    :param divisor: The value of the digit (divisor)
+    :return: The generator of the fractional digits (characters)
+    """
+    alphabet = get_codec(p).alphabet
+    while remainder:
+        remainder *= p  # A zero is "lowered", so we can just multiply the dividend with the base
+        yield alphabet[remainder // divisor]
+        remainder %= divisor
+
+
+def division(p, n, d, out=None, trace=None):
+    """
+    This function performs the division between a number [n] and a digit [d], in a base [p], and
+    return the result.
+    For this, the number is parsed from left to right:
+    1. We find the current digit of the result, being the quotient of the current dividend and the
+    digit (in the base [p]).
+    2. The following dividend will be as it is done in a manual division, we keep the modulo of
+    the dividend and the digit, and we "lower" a next digit of the number, or simply:
+    the modulo is multiplied by the base, and we just add the next digit.
+    3. After we "lowered" all the digits, we create the fractional part, by doing the same
+    algorithm but by lowering fractionally zeros (see fraction_digits).
+    :param p: The base of the numbers
+    :param n: The number (dividend)
+    :param d: The digit (divisor)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result (quotient) of the division
+    """
+    divisor = value(digits_of(d))
+    result, remainder = integer_division(p, n, divisor)
+    if trace is not None:
+        trace("integer_part", base=p, number=n, digit=d, quotient=result, remainder=remainder)
+    fraction = "".join(islice(fraction_digits(p, remainder, divisor), 10))  # We consider 10 fractional digits
+    # to be enough
+    fraction = fraction.rstrip('0')
+    if fraction:  # We may not have a fractional part, so we don't add the point
+        result += '.' + fraction
+    if trace is not None:
+        trace("fractional_part", digits=fraction, result=result)
+    return write_output(result, out)
+
+
+def division_digits(p, n, d, trace=None):
+    """
+    This function generates the result of the division between a number [n] and a digit [d], in a base [p],
+    one character at a time: the digits of the quotient, then (if the division is not exact) the point and
+    the fractional digits, which are computed only when they are needed (so the caller decides how many,
+    for example with itertools.islice). If the fractional part is periodic, the generation never stops.
+    :param p: The base of the numbers
+    :param n: The number (dividend)
+    :param d: The digit (divisor)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The generator of the characters of the result
+    """
+    divisor = value(digits_of(d))
+    result, remainder = integer_division(p, n, divisor)
+    if trace is not None:
+        trace("integer_part", base=p, number=n, digit=d, quotient=result, remainder=remainder)
+    yield from result
+    if remainder:
+        yield '.'
+        yield from fraction_digits(p, remainder, divisor)
+
+
+def periodic_division(p, n, d, out=None, trace=None):
+    """
+    This function performs the division between a number [n] and a digit [d], in a base [p], and returns the
+    exact result, with the period of the fractional part in parentheses (for example 0.1(6) for 1/6 in base 10).
+    The fractional digits are computed as in division, but every remainder is kept with the position of its digit:
+    when a remainder repeats, the digits from its first position repeat forever, so that is the period.
+    There are fewer remainders than the value of the divisor, so we stop after at most that many digits.
+    :param p: The base of the numbers
+    :param n: The number (dividend)
+    :param d: The digit (divisor)
+    :param out: The buffer for the result (by default, the result is a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The result of the division
+    """
+    divisor = value(digits_of(d))
+    result, remainder = integer_division(p, n, divisor)
+    if trace is not None:
+        trace("integer_part", base=p, number=n, digit=d, quotient=result, remainder=remainder)
+    alphabet = get_codec(p).alphabet
+    positions = {}  # The position of the digit of every remainder
+    fraction = []
+    while remainder and remainder not in positions:
+        positions[remainder] = len(fraction)
+        remainder *= p
+        fraction.append(alphabet[remainder // divisor])
+        remainder %= divisor
+        if trace is not None:
+            trace("fractional_digit", position=len(fraction), digit=fraction[-1], remainder=remainder)
+    if not fraction:
+        return write_output(result, out)
+    if not remainder:  # The division is exact
+        return write_output(result + '.' + "".join(fraction), out)
+    start = positions[remainder]
+    if trace is not None:
+        trace("period", start=start + 1, length=len(fraction) - start)  # The remainder repeats from [start]
+    return write_output("%s.%s(%s)" % (result, "".join(fraction[:start]), "".join(fraction[start:])), out)
+
+
+def newton_divmod(x, d):
+    """
+    This function computes and returns the quotient and the remainder of the division between two
+    integers [x] and [d], using the reciprocal of [d] computed with Newton's iteration (see functions.reciprocal).
+    The quotient is the product of [x] and the reciprocal (with a correction of at most a few units),
+    so the division costs about as much as a multiplication.
+    :param x: The dividend
+    :param d: The divisor
+    :return: The quotient and the remainder
+    """
+    if x < d:
+        return 0, x
+    k = x.bit_length()
+    return fast_divmod(x, d, reciprocal(d, k), k)
+
+
+def divide(p, n1, n2, precision=10, out=None, trace=None):
+    """
+    This function performs the division between two numbers [n1] and [n2] (of any length) in a base [p],
+    and returns the quotient (with at most [precision] fractional digits) and the remainder.
+    For this, [precision] zeros are "lowered" after the dividend (it is multiplied by p^precision), and the
+    division is done on the values of the numbers:
+    1. For small divisors, as a long division.
+    2. For big divisors (from NEWTON_DIVISION_BITS bits), by multiplying with the reciprocal of the divisor.
+    The last [precision] digits of the quotient are the fractional part (without the trailing zeros), and
+    the remainder is the one left after the last lowered digit, so n1 * p^precision = q * n2 + remainder
+    (where q is the quotient without the point).
+    :param p: The base of the numbers
+    :param n1: The first number (dividend)
+    :param n2: The second number (divisor, not zero)
+    :param precision: The number of fractional digits
+    :param out: The buffer for the quotient (by default, the quotient is a string; the remainder is always
+    a string)
+    :param trace: The trace of the steps (see steps.py), or None
+    :return: The quotient and the remainder
+    """
+    x = to_integer(p, digits_of(n1)) * p ** precision
+    d = to_integer(p, digits_of(n2))
+    if d.bit_length() < NEWTON_DIVISION_BITS:
+        q, r = divmod(x, d)
+    else:
+        q, r = newton_divmod(x, d)
+    if trace is not None:
+        trace("values", dividend=x, divisor=d, quotient=q, remainder=r,
+              method="long division" if d.bit_length() < NEWTON_DIVISION_BITS else "newton")
+    quotient = from_integer(p, q).rjust(precision + 1, "0")
+    integer_part = quotient[:len(quotient) - precision]
+    fractional_part = quotient[len(quotient) - precision:].rstrip("0")
+    if fractional_part:
+        integer_part += "." + fractional_part
+    return write_output(integer_part, out), from_integer(p, r)
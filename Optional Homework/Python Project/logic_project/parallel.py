@@ -0,0 +1,202 @@
+"""
+This module contains the parallel conversion of a single (very long) number, which spreads the top levels
+of the divide-and-conquer conversion (see conversions.divide_and_conquer) over several processes.
+The digits and the values are passed to the workers through shared memory, not as pickled strings.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import log2
+from multiprocessing.shared_memory import SharedMemory
+
+from .functions import to_integer
+from .functions import from_integer
+from .functions import reciprocal
+from .functions import fast_divmod
+from .conversions import divide_and_conquer
+from .power_cache import power
+
+
+def value_bytes(p, length):
+    """
+    This function computes and returns how many bytes are enough for the value of any number with [length]
+    digits in a base [p].
+    :param p: The base
+    :param length: The number of digits
+    :return: The number of bytes
+    """
+    return int(length * log2(p)) // 8 + 2
+
+
+def parse_segment(digits_name, start, stop, b, values_name, offset, size):
+    """
+    This function converts a segment of the digits of a number (in a worker process) into an integer, and writes
+    the integer into the shared memory of the values.
+    :param digits_name: The name of the shared memory with the digits
+    :param start: The position of the first digit of the segment
+    :param stop: The position after the last digit of the segment
+    :param b: The base of the number
+    :param values_name: The name of the shared memory for the values
+    :param offset: The position of the value in the shared memory of the values
+    :param size: The number of bytes of the value
+    """
+    digits, values = SharedMemory(digits_name), SharedMemory(values_name)
+    try:
+        number = to_integer(b, bytes(digits.buf[start:stop]).decode("ascii"))
+        values.buf[offset:offset + size] = number.to_bytes(size, "little")
+    finally:
+        digits.close()
+        values.close()
+
+
+def write_segment(values_name, offset, size, h, digits_name, start, width):
+    """
+    This function converts an integer (in a worker process), read from the shared memory of the values, into
+    exactly [width] digits in a base [h] (with leading zeros), and writes them into the shared memory of the digits.
+    :param values_name: The name of the shared memory with the values
+    :param offset: The position of the value in the shared memory of the values
+    :param size: The number of bytes of the value
+    :param h: The destination base
+    :param digits_name: The name of the shared memory for the digits
+    :param start: The position of the first digit
+    :param width: The number of digits
+    """
+    values, digits = SharedMemory(values_name), SharedMemory(digits_name)
+    try:
+        number = int.from_bytes(values.buf[offset:offset + size], "little")
+        digits.buf[start:start + width] = from_integer(h, number).rjust(width, "0").encode("ascii")
+    finally:
+        values.close()
+        digits.close()
+
+
+def split(number, h, width, count):
+    """
+    This function splits an integer into [count] pieces of [width] digits in a base [h], from left to right,
+    as on the top levels of the divide-and-conquer conversion: the integer is divided by h^(width * half) and
+    the quotient and the remainder are split in the same way.
+    :param number: The integer (smaller than h^(width * count))
+    :param h: The destination base
+    :param width: The number of digits of a piece
+    :param count: The number of pieces
+    :return: The list of the pieces (integers)
+    """
+    if count == 1:
+        return [number]
+    half = count // 2
+    d = power(h, width * half)
+    k = max(number.bit_length(), 2 * d.bit_length())
+    q, r = fast_divmod(number, d, reciprocal(d, k), k)
+    return split(q, h, width, count - half) + split(r, h, width, half)
+
+
+def combine(values, b, width):
+    """
+    This function combines the values of [len(values)] segments of [width] digits in a base [b] (from left
+    to right, the first one may be shorter) into the value of the whole number, in pairs (as on the top levels
+    of the divide-and-conquer conversion).
+    :param values: The values of the segments
+    :param b: The base of the number
+    :param width: The number of digits of a segment (except the first one)
+    :return: The value of the number
+    """
+    if len(values) == 1:
+        return values[0]
+    half = len(values) // 2
+    return combine(values[:-half], b, width) * power(b, width * half) + combine(values[-half:], b, width)
+
+
+def parallel_convert(b, h, n, workers=4, pool=None):
+    """
+    This function converts a number [n] from a base [b] to a base [h], using the divide-and-conquer method on
+    [workers] processes.
+    1. The digits are put in shared memory and split in [workers] segments, which are converted into integers
+    by the workers (in parallel), and the values are combined.
+    2. The value is split by powers of [h] into [workers] pieces, which are written in base [h] by the workers
+    (in parallel), directly into the shared memory of the result.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base, without leading zeros)
+    :param workers: The number of worker processes
+    :param pool: An existing pool of processes (by default, a new one is created)
+    :return: The converted number in base [h]
+    """
+    width = -(-len(n) // workers)  # The number of digits of a segment (the first one may be shorter)
+    if workers == 1 or width * (workers - 1) >= len(n):
+        return divide_and_conquer(b, h, n)
+    own_pool = pool is None
+    if own_pool:
+        pool = ProcessPoolExecutor(workers)
+    memories = []
+    try:
+        size = value_bytes(b, width)
+        digits = SharedMemory(create=True, size=len(n))
+        values = SharedMemory(create=True, size=size * workers)
+        memories += [digits, values]
+        digits.buf[:len(n)] = n.encode("ascii")
+        bounds = [(max(stop - width, 0), stop) for stop in range(len(n) - width * (workers - 1), len(n) + 1, width)]
+        for future in [pool.submit(parse_segment, digits.name, start, stop, b, values.name, i * size, size)
+                       for i, (start, stop) in enumerate(bounds)]:
+            future.result()
+        number = combine([int.from_bytes(values.buf[i * size:(i + 1) * size], "little") for i in range(workers)],
+                         b, width)
+        length = int(number.bit_length() / log2(h)) + 1  # At least the number of digits in base [h]
+        width = -(-length // workers)
+        size = value_bytes(h, width)
+        pieces = SharedMemory(create=True, size=size * workers)
+        result = SharedMemory(create=True, size=width * workers)
+        memories += [pieces, result]
+        for i, piece in enumerate(split(number, h, width, workers)):
+            pieces.buf[i * size:(i + 1) * size] = piece.to_bytes(size, "little")
+        for future in [pool.submit(write_segment, pieces.name, i * size, size, h, result.name, i * width, width)
+                       for i in range(workers)]:
+            future.result()
+        return bytes(result.buf[:width * workers]).decode("ascii").lstrip("0") or "0"
+    finally:
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+        if own_pool:
+            pool.shutdown()
+
+
+def scaling_report(b, h, n, worker_counts=(2, 4, 8, 16)):
+    """
+    This function measures the parallel conversion of a number on different numbers of workers, compared
+    with the conversion on a single process, and computes the scaling efficiency
+    (the speedup divided by the number of workers).
+    The pools are started before the measurements, so that only the conversions are measured.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (in the source base)
+    :param worker_counts: The numbers of workers
+    :return: The list of (workers, time in seconds, speedup, efficiency), starting with the single process
+    """
+    start = time.perf_counter()
+    expected = divide_and_conquer(b, h, n)
+    single = time.perf_counter() - start
+    report = [(1, single, 1.0, 1.0)]
+    for workers in worker_counts:
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(abs, range(workers)))  # The workers are started before the measurement
+            start = time.perf_counter()
+            result = parallel_convert(b, h, n, workers, pool)
+            elapsed = time.perf_counter() - start
+        if result != expected:
+            raise RuntimeError("The parallel conversion gave a different result.")
+        report.append((workers, elapsed, single / elapsed, single / elapsed / workers))
+    return report
+
+
+def print_scaling(b, h, n, worker_counts=(2, 4, 8, 16)):
+    """
+    This function prints the scaling report of a parallel conversion (see scaling_report), as a table.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (in the source base)
+    :param worker_counts: The numbers of workers
+    """
+    print("Converting", len(n), "digits from base", b, "to base", h)
+    print("%8s %12s %10s %12s" % ("workers", "time (s)", "speedup", "efficiency"))
+    for workers, elapsed, speedup, efficiency in scaling_report(b, h, n, worker_counts):
+        print("%8d %12.3f %10.2f %11.0f%%" % (workers, elapsed, speedup, efficiency * 100))
@@ -0,0 +1,159 @@
+"""
+This module contains the conversion planner, which chooses the fastest conversion method for two bases and
+a number, using a cost model.
+The cost model is calibrated once, by measuring every method on this machine, and it is kept in a file,
+so that the next runs don't measure again.
+"""
+
+import json
+import os
+import time
+from bisect import bisect_left
+from math import log
+
+from . import conversions
+from .functions import char
+
+# The version of the cost model (a model saved with another version is calibrated again)
+MODEL_VERSION = 1
+# The file where the cost model is kept (it can be changed with the LOGIC_PLANNER_CACHE environment variable)
+MODEL_PATH = os.environ.get("LOGIC_PLANNER_CACHE",
+                            os.path.join(os.path.expanduser("~"), ".cache", "logic-project", "planner.json"))
+# The lengths (in digits) of the numbers used for the calibration
+CALIBRATION_LENGTHS = (8, 32, 128, 512, 2048)
+# For every relationship between the bases, the pair of bases used for the calibration
+CALIBRATION_BASES = {"root": (16, 2), "smaller": (3, 10), "greater": (10, 3)}
+# The conversion methods
+METHODS = {"rapid": conversions.rapid_conversions,
+           "substitution": conversions.substitution_method,
+           "successive": conversions.successive_divisions,
+           "intermediate": conversions.intermediate_base}
+
+model = None  # The cost model (loaded or calibrated at the first conversion)
+
+
+def relationship(b, h):
+    """
+    This function computes and returns the relationship between two bases, which decides the costs of the methods:
+    "root" if they are powers of a common root, "smaller" if the source base is smaller, "greater" otherwise.
+    :param b: The source base
+    :param h: The destination base
+    :return: The relationship
+    """
+    if conversions.common_root(b, h) is not None:
+        return "root"
+    return "smaller" if b < h else "greater"
+
+
+def methods(b, h):
+    """
+    This function returns the names of the methods that can convert between two bases (the rapid conversions
+    need a common root).
+    :param b: The source base
+    :param h: The destination base
+    :return: The list of the names of the methods
+    """
+    return [name for name in METHODS if name != "rapid" or relationship(b, h) == "root"]
+
+
+def measure(method, b, h, length):
+    """
+    This function measures and returns the time (in seconds) of the conversion of a [length]-digit number
+    with a method (the best of 3 runs).
+    :param method: The conversion method
+    :param b: The source base
+    :param h: The destination base
+    :param length: The number of digits
+    :return: The time, in seconds
+    """
+    n = char(b - 1) * length
+    best = None
+    for i in range(3):
+        start = time.perf_counter()
+        method(b, h, n)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def calibrate():
+    """
+    This function calibrates the cost model: every method is measured for every relationship between the bases,
+    on numbers of every length from CALIBRATION_LENGTHS.
+    :return: The cost model: for every relationship and method, the list of times (one for every length)
+    """
+    costs = {}
+    for kind, (b, h) in CALIBRATION_BASES.items():
+        costs[kind] = {name: [measure(METHODS[name], b, h, length) for length in CALIBRATION_LENGTHS]
+                       for name in methods(b, h)}
+    return {"version": MODEL_VERSION, "lengths": list(CALIBRATION_LENGTHS), "costs": costs}
+
+
+def load_model(path=MODEL_PATH):
+    """
+    This function loads the cost model from a file, or calibrates it (and saves it) if the file doesn't exist
+    or has another version.
+    :param path: The path of the file
+    :return: The cost model
+    """
+    try:
+        with open(path) as file:
+            saved = json.load(file)
+        if saved.get("version") == MODEL_VERSION and saved.get("lengths") == list(CALIBRATION_LENGTHS):
+            return saved
+    except (OSError, ValueError):
+        pass
+    calibrated = calibrate()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(calibrated, file)
+    except OSError:
+        pass  # The model can still be used, it will just be calibrated again next time
+    return calibrated
+
+
+def predict(times, length):
+    """
+    This function predicts the time of a conversion of a [length]-digit number from the measured times,
+    by interpolating between the two closest measured lengths (on a log-log scale, so that the growth of
+    the method is kept). Outside the measured lengths, the growth of the last two lengths continues.
+    :param times: The measured times (one for every length from CALIBRATION_LENGTHS)
+    :param length: The number of digits
+    :return: The predicted time, in seconds
+    """
+    lengths = CALIBRATION_LENGTHS
+    i = min(max(bisect_left(lengths, length), 1), len(lengths) - 1)
+    x0, x1 = log(lengths[i - 1]), log(lengths[i])
+    y0, y1 = log(max(times[i - 1], 1e-9)), log(max(times[i], 1e-9))
+    return y0 + (y1 - y0) * (log(max(length, 1)) - x0) / (x1 - x0)  # The logarithm of the time is enough
+
+
+def plan(b, h, length):
+    """
+    This function chooses the fastest method for converting a [length]-digit number between two bases,
+    by the predicted times of the cost model.
+    :param b: The source base
+    :param h: The destination base
+    :param length: The number of digits
+    :return: The name of the method
+    """
+    global model
+    if model is None:
+        model = load_model()
+    costs = model["costs"][relationship(b, h)]
+    return min(methods(b, h), key=lambda name: predict(costs[name], length))
+
+
+def convert(b, h, n):
+    """
+    This function converts a number [n] from a base [b] to a base [h], with the fastest method
+    (see plan), so the callers don't have to choose one.
+    :param b: The source base
+    :param h: The destination base
+    :param n: The number (initially in the source base, without leading zeros)
+    :return: The converted number in base [h]
+    """
+    if b == h or n == "0":
+        return n
+    return METHODS[plan(b, h, len(n))](b, h, n)
@@ -0,0 +1,130 @@
+"""
+This module contains the cache of the power tables, shared by all the conversions of the process: the powers of
+the bases (and their reciprocals, and the tables of digit groups) are kept, so that repeated conversions between
+the same bases don't compute them again.
+The cache has a memory budget: when it is exceeded, the least recently used tables are removed.
+"""
+
+from collections import OrderedDict
+
+# The default memory budget of the cache, in bytes
+MAX_BYTES = 64 << 20
+
+
+def size_of(table):
+    """
+    This function estimates and returns the memory used by a table (an integer or a list of strings), in bytes.
+    :param table: The table
+    :return: The number of bytes
+    """
+    if isinstance(table, int):
+        return table.bit_length() // 8 + 32
+    return sum(len(element) + 56 for element in table) + 8 * len(table) + 56
+
+
+class PowerCache:
+    """
+    This class represents a cache of tables with a memory budget and LRU eviction: every table has a key
+    (for example ("power", base, exponent)), and when the tables use more than the budget, the ones used
+    the longest time ago are removed.
+    The cache also counts the hits (tables found), the misses (tables computed) and the evictions.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        """
+        :param max_bytes: The memory budget, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.tables = OrderedDict()  # The tables (with their sizes), from the least recently used one
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key, compute):
+        """
+        This function returns the table with a certain key, computing it (and keeping it) if it's not in the cache.
+        :param key: The key of the table
+        :param compute: The function that computes the table (with no parameters)
+        :return: The table
+        """
+        if key in self.tables:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return self.tables[key][0]
+        self.misses += 1
+        table = compute()
+        size = size_of(table)
+        if size <= self.max_bytes:
+            self.tables[key] = (table, size)
+            self.bytes += size
+            self.evict()
+        return table
+
+    def evict(self):
+        """
+        This function removes the least recently used tables, until the memory budget is respected.
+        """
+        while self.bytes > self.max_bytes:
+            key, (table, size) = self.tables.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def configure(self, max_bytes):
+        """
+        This function changes the memory budget of the cache (removing tables, if needed).
+        :param max_bytes: The memory budget, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def clear(self):
+        """
+        This function removes all the tables and resets the statistics.
+        """
+        self.tables.clear()
+        self.bytes = self.hits = self.misses = self.evictions = 0
+
+    def statistics(self):
+        """
+        :return: A dictionary with the hits, misses, evictions, the number of tables and the memory used
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "tables": len(self.tables), "bytes": self.bytes, "max_bytes": self.max_bytes}
+
+
+# The cache of the process
+CACHE = PowerCache()
+
+
+def power(base, exponent):
+    """
+    This function returns the power base^exponent, from the cache.
+    An even power is computed as the square of the half power (which is also kept), so the powers
+    b^(k * 2^j) used by the divide-and-conquer conversions are built by squaring.
+    :param base: The base
+    :param exponent: The exponent
+    :return: The power
+    """
+    def compute():
+        if exponent > 1 and exponent % 2 == 0:
+            half = power(base, exponent // 2)
+            return half * half
+        return base ** exponent
+
+    return CACHE.lookup(("power", base, exponent), compute)
+
+
+def configure(max_bytes):
+    """
+    This function changes the memory budget of the cache of the process.
+    :param max_bytes: The memory budget, in bytes
+    """
+    CACHE.configure(max_bytes)
+
+
+def statistics():
+    """
+    :return: The statistics of the cache of the process (see PowerCache.statistics)
+    """
+    return CACHE.statistics()
@@ -0,0 +1,239 @@
+"""
+This module contains the conversion service, a local server that performs the operations and the conversions
+for many clients at once, without starting the app (and without the interactive prompts) for every request.
+The clients connect over TCP or a Unix socket and send requests as JSON lines, answered as JSON lines:
+    {"id": 1, "function": "addition", "args": [10, "123", "456"]}      (any function of FUNCTIONS)
+    {"id": 1, "result": "579"}                                          (or {"id": 1, "error": "..."})
+The answers are written as soon as they are ready, so they may come in another order (the id tells them apart).
+Started as "python -m logic_project.service [--host <host>] [--port <number> | --unix <path>]
+[--workers <number>]", it serves until it is stopped.
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from . import operations
+from . import conversions
+from .functions import valid_base
+from .codec import get_codec
+
+# The functions of the service: the function and the kind of its arguments ("operation": a base and numbers,
+# "digit": a base, a number and a digit, "conversion": two bases and a number)
+FUNCTIONS = {"addition": (operations.addition, "operation"),
+             "subtraction": (operations.subtraction, "operation"),
+             "multiplication": (operations.multiplication, "digit"),
+             "division": (operations.division, "digit"),
+             "periodic_division": (operations.periodic_division, "digit"),
+             "multiply": (operations.multiply, "operation"),
+             "divide": (operations.divide, "operation"),
+             "successive_divisions": (conversions.successive_divisions, "conversion"),
+             "substitution_method": (conversions.substitution_method, "conversion"),
+             "intermediate_base": (conversions.intermediate_base, "conversion"),
+             "rapid_conversions": (conversions.rapid_conversions, "conversion"),
+             "divide_and_conquer": (conversions.divide_and_conquer, "conversion")}
+# The requests with at most this many digits are performed directly (sending them to a worker costs more)
+INLINE_DIGITS = 4096
+# The maximum number of requests of a client performed at the same time (the next ones wait)
+CLIENT_REQUESTS = 64
+# The longest request line accepted, in bytes
+LINE_BYTES = 1 << 26
+
+
+def base(p):
+    """
+    This function validates and returns a base (from a request).
+    :param p: The base (an integer or a string)
+    :return: The base (an integer)
+    """
+    if isinstance(p, bool) or not isinstance(p, (int, str)) or not valid_base(p):
+        raise ValueError("The base is not valid.")
+    return int(p)
+
+
+def number(p, n):
+    """
+    This function validates and returns a number in a base [p] (from a request), without leading zeros
+    and with uppercase digits.
+    :param p: The base of the number
+    :param n: The number (a string)
+    :return: The number
+    """
+    if not isinstance(n, str):
+        raise ValueError("The numbers must be strings.")
+    try:
+        return get_codec(p).normalize(n)
+    except ValueError:
+        raise ValueError("The number is not valid in the selected base.")
+
+
+def arguments(name, args):
+    """
+    This function validates the arguments of a request for a function of FUNCTIONS, and returns them ready
+    for the function (as the interactive app does).
+    :param name: The name of the function
+    :param args: The arguments (a list)
+    :return: The validated arguments (a tuple)
+    """
+    if name not in FUNCTIONS:
+        raise ValueError("The function is not known.")
+    kind = FUNCTIONS[name][1]
+    if not isinstance(args, list):
+        raise ValueError("The arguments must be a list.")
+    if kind == "conversion" and len(args) == 3:
+        b, h = base(args[0]), base(args[1])
+        return b, h, number(b, args[2])
+    if kind == "digit" and len(args) == 3:
+        p = base(args[0])
+        n, d = number(p, args[1]), number(p, args[2])
+        if len(d) != 1 or d == "0":
+            raise ValueError("The digit is not valid in the selected base (or it is zero).")
+        return p, n, d
+    if name == "divide" and len(args) == 4:
+        if isinstance(args[3], bool) or not isinstance(args[3], int) or args[3] < 0:
+            raise ValueError("The number of fractional digits is not valid.")
+        return arguments(name, args[:3]) + (args[3],)
+    if kind == "operation" and len(args) == 3:
+        p = base(args[0])
+        n1, n2 = number(p, args[1]), number(p, args[2])
+        if name == "divide" and n2 == "0":
+            raise ValueError("The divisor cannot be zero.")
+        return p, n1, n2
+    raise ValueError("The number of arguments is not valid.")
+
+
+def perform(name, args):
+    """
+    This function performs a request (in a worker process, or directly).
+    :param name: The name of the function
+    :param args: The validated arguments
+    :return: The result (a string, or a list for divide)
+    """
+    result = FUNCTIONS[name][0](*args)
+    return list(result) if isinstance(result, tuple) else result
+
+
+class Service:
+    """
+    This class represents the conversion service: the pool of worker processes, and the requests being
+    performed, so that identical requests (from any client) are performed only once.
+    """
+
+    def __init__(self, workers=None):
+        """
+        :param workers: The number of worker processes (by default, the number of processors)
+        """
+        self.pool = ProcessPoolExecutor(workers)
+        self.pending = {}  # The results of the requests being performed (futures), by their function and arguments
+
+    async def result(self, name, args):
+        """
+        This function performs a request and returns its result. The small requests are performed directly,
+        and the others by a worker process. If an identical request is being performed, its result is awaited
+        instead (the requests are coalesced).
+        :param name: The name of the function
+        :param args: The arguments (not validated)
+        :return: The result
+        """
+        args = arguments(name, args)
+        if sum(len(arg) for arg in args if isinstance(arg, str)) <= INLINE_DIGITS:
+            return perform(name, args)
+        key = (name, args)
+        if key not in self.pending:
+            future = asyncio.get_running_loop().run_in_executor(self.pool, perform, name, args)
+            self.pending[key] = future
+            future.add_done_callback(lambda done: self.pending.pop(key, None))
+        return await asyncio.shield(self.pending[key])  # A client that disconnects doesn't cancel the others
+
+    async def answer(self, line, writer, limit):
+        """
+        This function answers a request line of a client, and allows the next request of the client.
+        :param line: The request (a JSON line)
+        :param writer: The stream of the client
+        :param limit: The semaphore that limits the requests of the client
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("The request must be a JSON object.")
+            request_id = request.get("id")
+            answer = {"id": request_id, "result": await self.result(request.get("function"), request.get("args"))}
+        except Exception as e:
+            answer = {"id": request_id, "error": str(e)}
+        finally:
+            limit.release()
+        if not writer.is_closing():
+            writer.write(json.dumps(answer).encode("ascii") + b"\n")
+
+    async def client(self, reader, writer):
+        """
+        This function serves a client: every request line is answered separately, at most CLIENT_REQUESTS
+        at the same time (the next line is read only when a request finishes).
+        :param reader: The stream of the requests
+        :param writer: The stream of the answers
+        """
+        limit = asyncio.Semaphore(CLIENT_REQUESTS)
+        tasks = set()
+        try:
+            while True:
+                await limit.acquire()
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    limit.release()
+                    continue
+                task = asyncio.ensure_future(self.answer(line, writer, limit))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.wait(tasks)
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            pass  # The client disconnected (or sent a line longer than LINE_BYTES)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, path=None):
+        """
+        This function starts the service on a TCP port (or on a Unix socket, if a path is given) and serves
+        the clients until it is cancelled.
+        :param host: The host of the TCP server
+        :param port: The port of the TCP server
+        :param path: The path of the Unix socket
+        """
+        if path is None:
+            server = await asyncio.start_server(self.client, host, port, limit=LINE_BYTES)
+        else:
+            server = await asyncio.start_unix_server(self.client, path, limit=LINE_BYTES)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown()
+
+
+def main(argv=None):
+    """
+    This function starts the service from the command line (see the description of the module).
+    :param argv: The arguments (by default, the ones of the command line)
+    """
+    parser = argparse.ArgumentParser(description="The conversion service (JSON lines over TCP or a Unix socket).")
+    parser.add_argument("--host", default="127.0.0.1", help="the host of the TCP server")
+    parser.add_argument("--port", type=int, default=8765, help="the port of the TCP server")
+    parser.add_argument("--unix", help="the path of a Unix socket (instead of TCP)")
+    parser.add_argument("--workers", type=int, help="the number of worker processes")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(Service(args.workers).serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+This module starts the application.
+Started as "start.py --batch <file> [--workers <number>]", the app runs in batch mode (see batch.py), reading
+the jobs from the file (or from the standard input, if the file is "-"), on the given number of processes.
+"""
+
+import sys
+
+
+def main(argv=None):
+    """
+    This function starts the app: the batch mode, or the interactive menu (see the description of the module).
+    The modules of the chosen mode are only imported here, so importing this module doesn't start anything.
+    :param argv: The arguments (by default, the ones of the command line, without the name of the program)
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) in (2, 4) and argv[0] == "--batch":
+        if len(argv) == 4 and (argv[2] != "--workers" or not argv[3].isdigit() or argv[3] == "0"):
+            sys.exit("Usage: start.py --batch <file> [--workers <number>]")
+        from .batch import main as batch_main
+        batch_main(argv[1], int(argv[3]) if len(argv) == 4 else 1)
+    else:
+        from .ui import menu
+        menu()
@@ -0,0 +1,88 @@
+"""
+This module contains the step traces, which record the steps of the operations and of the conversions, so that
+the methods can be shown step by step (the remainders of the successive divisions, the partial sums of the
+substitution method, the digit groups of the rapid conversions, ...).
+Every operation and conversion accepts a trace, any function called as trace(step, **details) for every step.
+Without a trace, the steps are not even created. Some details are lazy (generators, for example of the digit
+groups), so they are only computed if the trace reads them.
+A StepTrace keeps the steps as events (dictionaries), bounded for huge numbers: only the first steps (and the
+first elements of the lazy details) are kept, and the long numbers are truncated.
+"""
+
+from itertools import islice
+from types import GeneratorType
+
+# The default maximum number of steps kept (and of elements kept from a lazy detail)
+STEP_LIMIT = 1000
+# The default maximum number of characters of a number kept in a step (the longer ones are truncated)
+DETAIL_WIDTH = 64
+
+
+class StepTrace:
+    """
+    This class represents a trace that keeps the steps as events: every event is a dictionary with the name of
+    the step ("step") and its details. At most [limit] events are kept; the next ones are only counted.
+    """
+
+    def __init__(self, limit=STEP_LIMIT, width=DETAIL_WIDTH):
+        """
+        :param limit: The maximum number of events kept (and of elements kept from a lazy detail)
+        :param width: The maximum number of characters of a number kept in an event
+        """
+        self.limit = limit
+        self.width = width
+        self.events = []
+        self.steps = 0  # The number of all the steps, including the ones not kept
+
+    def __call__(self, step, **details):
+        """
+        This function records a step (if less than [limit] events are kept).
+        :param step: The name of the step
+        :param details: The details of the step
+        """
+        self.steps += 1
+        if len(self.events) < self.limit:
+            event = {"step": step}
+            for name, detail in details.items():
+                event[name] = self.shorten(detail)
+            self.events.append(event)
+
+    def shorten(self, detail):
+        """
+        This function returns a detail of a step in the form it is kept: the long numbers (strings, buffers or
+        integers) are truncated, and the lazy details (generators) become lists of at most [limit] elements.
+        :param detail: The detail
+        :return: The detail, as it is kept
+        """
+        if isinstance(detail, GeneratorType):
+            return [self.shorten(element) for element in islice(detail, self.limit)]
+        if isinstance(detail, tuple):
+            return tuple(self.shorten(element) for element in detail)
+        half = self.width // 2
+        if isinstance(detail, (bytes, bytearray, memoryview)):
+            if len(detail) > self.width:
+                return "%s...%s (%d digits)" % (bytes(detail[:half]).decode("ascii"),
+                                                bytes(detail[len(detail) - half:]).decode("ascii"), len(detail))
+            return bytes(detail).decode("ascii")
+        if isinstance(detail, str) and len(detail) > self.width:
+            return "%s...%s (%d digits)" % (detail[:half], detail[len(detail) - half:], len(detail))
+        if isinstance(detail, int) and not isinstance(detail, bool) and detail.bit_length() > 3 * self.width:
+            return "(an integer of %d bits)" % detail.bit_length()  # Writing it in base 10 would be too slow
+        return detail
+
+    def dropped(self):
+        """
+        :return: The number of steps that were not kept
+        """
+        return self.steps - len(self.events)
+
+    def lines(self):
+        """
+        This function writes the events, one on every line (for showing them).
+        :return: The list of lines
+        """
+        lines = ["%s: %s" % (event["step"], ", ".join("%s=%s" % (name, detail) for name, detail in event.items()
+                                                       if name != "step")) for event in self.events]
+        if self.dropped():
+            lines.append("... (%d more steps)" % self.dropped())
+        return lines
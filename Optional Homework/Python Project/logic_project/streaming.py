@@ -0,0 +1,166 @@
+"""
+This module contains the streaming conversions, functions that convert numbers stored in files (too big to
+be kept in memory as strings) between certain bases, reading and writing them piece by piece.
+The digits of a file can also be read backwards, for the streaming operations (see reversed_digits).
+"""
+
+import mmap
+
+from .functions import valid_number
+from .functions import DIGITS_16
+from .functions import to_integer
+from .functions import integer_pieces
+from .power_cache import power
+from .conversions import common_root
+from .conversions import root
+from .conversions import to_root_table
+from .conversions import convert_from_root
+
+# The number of digits read from the file at once
+CHUNK_DIGITS = 1 << 20
+# The characters ignored at the ends of a file
+WHITESPACE = b" \t\r\n"
+
+
+def digit_span(data):
+    """
+    This function finds where the digits of a number stored in a buffer begin and end, skipping the whitespace
+    at the ends of the buffer and the leading zeros of the number.
+    :param data: The buffer (for example a memory-mapped file)
+    :return: The position of the first digit and the position after the last digit
+    """
+    start, stop = 0, len(data)
+    while stop > start and data[stop - 1] in WHITESPACE:
+        stop -= 1
+    while start < stop and data[start] in WHITESPACE:
+        start += 1
+    while start < stop - 1 and data[start] == ord("0"):  # We keep at least one digit
+        start += 1
+    if start == stop:
+        raise ValueError("The file does not contain a number.")
+    return start, stop
+
+
+def digit_chunks(data, start, stop, b, chunk_digits):
+    """
+    This function generates the digits of a number stored in a buffer, in chunks of at most [chunk_digits] digits.
+    Every chunk is validated.
+    :param data: The buffer (for example a memory-mapped file)
+    :param start: The position of the first digit
+    :param stop: The position after the last digit
+    :param b: The base of the number
+    :param chunk_digits: The maximum number of digits of a chunk
+    :return: A generator of the chunks (in string format, with uppercase digits)
+    """
+    for i in range(start, stop, chunk_digits):
+        chunk = data[i:min(i + chunk_digits, stop)].decode("ascii").upper()
+        if not valid_number(b, chunk, DIGITS_16):
+            raise ValueError("The number is not valid in base %d." % b)
+        yield chunk
+
+
+def regroup_chunks(b, h, chunks, length):
+    """
+    This function converts a number given in chunks from a base [b] to a base [h], when the bases have
+    a common root [r] (b = r^x, h = r^y), generating the result in chunks as well (rapid conversions).
+    Every chunk is converted into base [r], and the digits in base [r] are regrouped [y] at a time.
+    Since the groups are made from right to left, we add (at the beginning) as many zeros as we need to have
+    a multiple of [y] digits, and the digits of a chunk that don't form a whole group are kept for the next chunk.
+    The leading zeros of the result are removed. Only one chunk is kept in memory at a time.
+    :param b: The source base
+    :param h: The destination base
+    :param chunks: The chunks of the number (from left to right, without leading zeros)
+    :param length: The number of digits of the number
+    :return: A generator of the chunks of the result
+    """
+    r, x = root(b)
+    y = root(h)[1]
+    rest = "0" * (-length * x % y)  # The leading zeros needed for whole groups
+    leading = True  # We are still at the beginning of the result (so its leading zeros are removed)
+    for chunk in chunks:
+        if b != r:
+            chunk = chunk.translate(to_root_table(b))
+        digits = rest + chunk
+        whole = len(digits) - len(digits) % y
+        digits, rest = digits[:whole], digits[whole:]
+        if h != r:
+            digits = convert_from_root(h, digits)
+        if leading:
+            digits = digits.lstrip("0")
+            leading = not digits
+        if digits:
+            yield digits
+    if leading:
+        yield "0"
+
+
+def iter_convert(src_path, b, h, chunk_digits=CHUNK_DIGITS):
+    """
+    This function converts a number stored in a file from a base [b] to a base [h], and generates the result
+    in chunks. The file is memory-mapped and read in chunks of [chunk_digits] digits.
+    1. If the bases have a common root, the conversion is a rapid conversion (see regroup_chunks), which
+    uses a constant amount of memory.
+    2. Otherwise, every chunk is converted into an integer, the integers are combined in pairs (multiplying by
+    the corresponding powers of [b]), and the result is generated piece by piece from the final integer,
+    so the memory used is about the size of the integer (not of the strings).
+    :param src_path: The path of the file with the number (in the source base)
+    :param b: The source base
+    :param h: The destination base
+    :param chunk_digits: The maximum number of digits read at once
+    :return: A generator of the chunks of the converted number (in base [h])
+    """
+    with open(src_path, "rb") as file:
+        if not file.seek(0, 2):  # An empty file cannot be memory-mapped
+            raise ValueError("The file does not contain a number.")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start, stop = digit_span(data)
+            chunks = digit_chunks(data, start, stop, b, chunk_digits)
+            if common_root(b, h) is not None:
+                yield from regroup_chunks(b, h, chunks, stop - start)
+                return
+            values = [(to_integer(b, chunk), len(chunk)) for chunk in chunks]
+    while len(values) > 1:  # We combine the neighbouring values: high * b^(length of low) + low
+        combined = []
+        for i in range(0, len(values) - 1, 2):
+            (high, high_length), (low, low_length) = values[i], values[i + 1]
+            combined.append((high * power(b, low_length) + low, high_length + low_length))
+        values = combined + values[len(combined) * 2:]
+    yield from integer_pieces(h, values[0][0])
+
+
+def convert_file(src_path, dst_path, b, h, chunk_digits=CHUNK_DIGITS):
+    """
+    This function converts a number stored in a file from a base [b] to a base [h], and writes the result
+    into another file, chunk by chunk (see iter_convert).
+    :param src_path: The path of the file with the number (in the source base)
+    :param dst_path: The path of the file for the result (in the destination base)
+    :param b: The source base
+    :param h: The destination base
+    :param chunk_digits: The maximum number of digits read at once
+    :return: The number of digits of the result
+    """
+    length = 0
+    with open(dst_path, "w") as file:
+        for chunk in iter_convert(src_path, b, h, chunk_digits):
+            file.write(chunk)
+            length += len(chunk)
+        file.write("\n")
+    return length
+
+
+def reversed_digits(src_path, chunk_digits=CHUNK_DIGITS):
+    """
+    This function generates the digits of a number stored in a file from right to left (the last digit first),
+    one at a time, for the streaming operations (see operations.stream_addition). The file is memory-mapped and
+    read backwards in chunks of [chunk_digits] digits, so it is never kept in memory.
+    :param src_path: The path of the file with the number
+    :param chunk_digits: The maximum number of digits read at once
+    :return: A generator of the digits (characters, from right to left)
+    """
+    with open(src_path, "rb") as file:
+        if not file.seek(0, 2):  # An empty file cannot be memory-mapped
+            raise ValueError("The file does not contain a number.")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start, stop = digit_span(data)
+            for i in range(stop, start, -chunk_digits):
+                yield from reversed(data[max(i - chunk_digits, start):i].decode("ascii"))
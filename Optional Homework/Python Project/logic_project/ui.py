@@ -7,11 +7,12 @@ the set {a,b,c,d,e,f,g} to the corresponding uppercase letter {A,B,C,D,E,F,G}
 "remove_leading_zeros" - we remove the leading zeros of a certain number
 """
 
-import operations
-import conversions
-from functions import valid_number
-from functions import valid_base
-from functions import remove_leading_zeros
+from . import operations
+from . import conversions
+from . import planner
+from .functions import valid_number
+from .functions import valid_base
+from .functions import remove_leading_zeros
 
 def personal_data():
     # This function prints the author's data for identification
@@ -100,9 +101,6 @@ def successive_divisions_ui(digits_16):
     if not valid_base(destination_base):
         raise Exception("Destination base not valid, please try again.")
     source_base, destination_base = int(source_base), int(destination_base)
-    if source_base <= destination_base:
-        raise Exception("This method is recommended when the source base > destination base, "
-                        "please choose another method.")
     number = input("Enter the number in the source base: ")
     number = remove_leading_zeros(number).upper()
     if not valid_number(source_base, number, digits_16):
@@ -119,9 +117,6 @@ def substitution_method_ui(digits_16):
     if not valid_base(destination_base):
         raise Exception("Destination base not valid, please try again.")
     source_base, destination_base = int(source_base), int(destination_base)
-    if source_base >= destination_base:
-        raise Exception("This method is recommended when the source base < destination base, "
-                        "please choose another method.")
     number = input("Enter the number in the source base: ")
     number = remove_leading_zeros(number).upper()
     if not valid_number(source_base, number, digits_16):
@@ -147,7 +142,6 @@ def intermediate_base_ui(digits_16):
 
 
 def rapid_conversions_ui(digits_16):
-    correct_bases = (2, 4, 8, 16)
     source_base = input("Enter the source base: ")
     if not valid_base(source_base):
         raise Exception("Source base not valid, please try again.")
@@ -155,8 +149,8 @@ def rapid_conversions_ui(digits_16):
     if not valid_base(destination_base):
         raise Exception("Destination base not valid, please try again.")
     source_base, destination_base = int(source_base), int(destination_base)
-    if not correct_bases.count(source_base) or not correct_bases.count(destination_base):
-        raise Exception("For rapid conversions, the bases should be powers of 2 (2,4,8,16), "
+    if conversions.common_root(source_base, destination_base) is None:
+        raise Exception("For rapid conversions, the bases should be powers of the same number (2,4,8,16 or 3,9), "
                         "please try another method.")
     number = input("Enter the number in the source base: ")
     number = remove_leading_zeros(number).upper()
@@ -166,15 +160,33 @@ def rapid_conversions_ui(digits_16):
           conversions.rapid_conversions(source_base, destination_base, number))
 
 
+def automatic_conversion_ui(digits_16):
+    source_base = input("Enter the source base: ")
+    if not valid_base(source_base):
+        raise Exception("Source base not valid, please try again.")
+    destination_base = input("Enter the destination base: ")
+    if not valid_base(destination_base):
+        raise Exception("Destination base not valid, please try again.")
+    source_base, destination_base = int(source_base), int(destination_base)
+    number = input("Enter the number in the source base: ")
+    number = remove_leading_zeros(number).upper()
+    if not valid_number(source_base, number, digits_16):
+        raise Exception("Number not valid in the selected source base, please try again.")
+    print("The number in base", destination_base, "is:",
+          planner.convert(source_base, destination_base, number))
+
+
 def conversion(digits_16):
     conversion_options = {1: successive_divisions_ui,
                           2: substitution_method_ui,
                           3: intermediate_base_ui,
-                          4: rapid_conversions_ui}
-    print("1. Using successive divisions (source base > destination base)")
-    print("2. Using substitution method (destination bases < source base)")
+                          4: rapid_conversions_ui,
+                          5: automatic_conversion_ui}
+    print("1. Using successive divisions (recommended when source base > destination base)")
+    print("2. Using substitution method (recommended when source base < destination base)")
     print("3. Using base 10 as an intermediate base")
-    print("4. Using rapid conversions (for bases: 2,4,8,16)")
+    print("4. Using rapid conversions (for bases: 2,4,8,16 or 3,9)")
+    print("5. Automatically, with the fastest method")
     try:
         cmd = int(input("Enter your option: "))
     except ValueError:
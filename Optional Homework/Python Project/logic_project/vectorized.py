@@ -0,0 +1,153 @@
+"""
+This module contains the batch conversions, functions that convert many (short) numbers at once between
+certain bases, doing every step on all the numbers together with NumPy arrays.
+NumPy is optional: without it, the numbers are converted one by one.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .functions import valid_number
+from .functions import DIGITS_16
+from .functions import char
+from .conversions import intermediate_base
+
+# The biggest value that fits in an int64 lane
+LANE_LIMIT = (1 << 63) - 1
+# The value of the characters that are not digits in the table of digit values
+INVALID = 255
+# The value of the characters used for padding (NUL and space), which are skipped
+PADDING = 254
+
+
+def lane_digits(p):
+    """
+    This function computes and returns how many digits in a base [p] fit in an int64 lane (so that every
+    number with that many digits is at most LANE_LIMIT).
+    :param p: The base
+    :return: The number of digits
+    """
+    k = 0
+    while p ** (k + 1) - 1 <= LANE_LIMIT:
+        k += 1
+    return k
+
+
+def digit_table(b):
+    """
+    This function creates the table of the values of all the characters (bytes) for a base [b]: the digits
+    have their value, the padding characters have PADDING and all the other ones have INVALID.
+    Both uppercase and lowercase letters are accepted.
+    :param b: The base
+    :return: The table (a NumPy array of 256 elements)
+    """
+    table = numpy.full(256, INVALID, dtype=numpy.uint8)
+    for digit in range(b):
+        table[ord(char(digit))] = digit
+        table[ord(char(digit).lower())] = digit
+    table[0] = table[ord(" ")] = PADDING
+    return table
+
+
+def to_matrix(numbers):
+    """
+    This function puts a batch of numbers into a matrix of bytes, one number on every row.
+    A list of numbers (strings or bytes) is aligned to the right, with leading zeros. A NumPy array of
+    fixed-width strings (or a matrix of bytes) is used as it is: its padding is skipped when decoding.
+    :param numbers: The numbers
+    :return: The matrix (a NumPy array of bytes, with a row for every number)
+    """
+    if isinstance(numbers, numpy.ndarray):
+        if numbers.dtype.kind == "U":
+            numbers = numbers.astype("S")
+        if numbers.dtype.kind == "S":
+            return numbers.view(numpy.uint8).reshape(len(numbers), numbers.dtype.itemsize)
+        return numbers.astype(numpy.uint8, copy=False)
+    width = max(map(len, numbers), default=1) or 1
+    if numbers and isinstance(numbers[0], (bytes, bytearray)):
+        data = b"".join([number.rjust(width, b"0") for number in numbers])
+    else:
+        data = "".join([number.rjust(width, "0") for number in numbers]).encode("ascii")
+    return numpy.frombuffer(data, dtype=numpy.uint8).reshape(len(numbers), width)
+
+
+def decode(b, matrix):
+    """
+    This function computes the values of all the numbers of a matrix of bytes in a base [b], by Horner's rule
+    applied on all the rows at once: for every column, the values are multiplied by [b] and the digits are added
+    (the padding characters are skipped).
+    :param b: The base of the numbers
+    :param matrix: The matrix of bytes (the numbers must fit in int64 lanes)
+    :return: The values (a NumPy array of int64)
+    """
+    digits = digit_table(b)[matrix]
+    if (digits == INVALID).any():
+        raise ValueError("The numbers are not valid in base %d." % b)
+    values = numpy.zeros(len(matrix), dtype=numpy.int64)
+    for column in digits.T:
+        values = numpy.where(column == PADDING, values, values * b + column)
+    return values
+
+
+def encode(h, values):
+    """
+    This function writes all the values in a base [h] at once: for every column, from right to left, the digit
+    is the modulo of the values and [h], and we keep the quotients (as in successive divisions).
+    The leading zeros of every number are removed at the end.
+    :param h: The destination base
+    :param values: The values (a NumPy array of int64, not negative)
+    :return: The list of the numbers in base [h] (in string format)
+    """
+    width, biggest = 1, int(values.max(initial=0))
+    while h ** width <= biggest:
+        width += 1  # The number of digits of the biggest value
+    alphabet = numpy.frombuffer("".join(char(digit) for digit in range(h)).encode("ascii"), dtype=numpy.uint8)
+    digits = numpy.empty((len(values), width), dtype=numpy.uint8)
+    for column in range(width - 1, -1, -1):
+        digits[:, column] = values % h
+        values = values // h
+    starts = numpy.where(digits.any(axis=1), (digits != 0).argmax(axis=1), width - 1)
+    data = alphabet[digits].tobytes().decode("ascii")
+    return [data[i * width + start:(i + 1) * width] for i, start in enumerate(starts.tolist())]
+
+
+def convert_many(b, h, numbers):
+    """
+    This function converts a batch of numbers from a base [b] to a base [h], and returns the results in the
+    same order.
+    The numbers are decoded into int64 lanes (see decode) and encoded into the destination base (see encode),
+    on all the numbers at once. The numbers that are too long for an int64 lane (more than lane_digits digits)
+    are converted separately, using base 10 as an intermediate base (which is exact for any length).
+    Without NumPy, all the numbers are converted that way.
+    :param b: The source base
+    :param h: The destination base
+    :param numbers: The numbers (a list of strings or a list of bytes, or a NumPy array of fixed-width strings)
+    :return: The list of the converted numbers (in base [h])
+    """
+    if numpy is None:
+        return [intermediate_base(b, h, number.upper().strip().lstrip("0") or "0") for number in numbers]
+    if isinstance(numbers, numpy.ndarray):
+        matrix = to_matrix(numbers)
+        if matrix.shape[1] <= lane_digits(b):
+            return encode(h, decode(b, matrix))
+        numbers = [bytes(row).replace(b"\0", b"").decode("ascii") for row in matrix]
+    width = lane_digits(b)
+    if max(map(len, numbers), default=0) <= width:
+        return encode(h, decode(b, to_matrix(numbers)))
+    short = [i for i, number in enumerate(numbers) if len(number) <= width]
+    results = [None] * len(numbers)
+    if short:
+        matrix = to_matrix([numbers[i] for i in short])
+        for i, result in zip(short, encode(h, decode(b, matrix))):
+            results[i] = result
+    for i, number in enumerate(numbers):
+        if results[i] is None:  # The number is too long for an int64 lane
+            if isinstance(number, (bytes, bytearray)):
+                number = number.decode("ascii")
+            number = number.upper().strip().lstrip("0") or "0"
+            if not valid_number(b, number, DIGITS_16):
+                raise ValueError("The numbers are not valid in base %d." % b)
+            results[i] = intermediate_base(b, h, number)
+    return results
@@ -1,7 +1,9 @@
 """
-This module starts the application.
+This module starts the application (see logic_project/start.py).
+Started as "start.py --batch <file> [--workers <number>]", the app runs in batch mode (see logic_project/batch.py).
 """
 
-from ui import menu
+from logic_project.start import main
 
-menu()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+This module contains the tests of the operations: the multiplication methods and the division of long numbers,
+compared with the products and the quotients of the built-in integers.
+"""
+
+import random
+
+import pytest
+
+from logic_project import operations
+from logic_project.functions import from_integer
+from logic_project.functions import to_integer
+
+# The bases of the tests
+BASES = (2, 3, 7, 10, 16)
+
+
+def random_number(p, length, rng):
+    """
+    This function creates a random number with [length] digits (without leading zeros) in a base [p].
+    :param p: The base
+    :param length: The number of digits
+    :param rng: The random generator
+    :return: The number (in string format)
+    """
+    return from_integer(p, rng.randrange(p ** (length - 1), p ** length))
+
+
+def limbs_value(limbs):
+    """
+    :param limbs: A list of limbs (from right to left, of 64 bits)
+    :return: The value of the limbs
+    """
+    return sum(limb << 64 * i for i, limb in enumerate(limbs))
+
+
+@pytest.mark.parametrize("method", [operations.karatsuba, operations.toom3])
+def test_limb_methods_unbalanced(method):
+    rng = random.Random(4)
+    for i in range(200):
+        a = [rng.randrange(1 << 60) for j in range(rng.randrange(1, 80))]
+        b = [rng.randrange(1 << 60) for j in range(rng.randrange(1, 80))]
+        assert limbs_value(method(a, b)) == limbs_value(a) * limbs_value(b)
+
+
+@pytest.mark.parametrize("p", BASES)
+@pytest.mark.parametrize("lengths", [(30, 30), (400, 450), (2500, 2500), (3000, 700), (5, 4000)])
+def test_multiply(p, lengths):
+    rng = random.Random(p * 1000 + lengths[0])
+    n1, n2 = random_number(p, lengths[0], rng), random_number(p, lengths[1], rng)
+    assert operations.multiply(p, n1, n2) == from_integer(p, to_integer(p, n1) * to_integer(p, n2))
+
+
+@pytest.mark.parametrize("p", BASES)
+def test_multiply_small_thresholds(p, monkeypatch):
+    monkeypatch.setattr(operations, "KARATSUBA_LIMBS", 2)  # Every method is used, even for short numbers
+    monkeypatch.setattr(operations, "TOOM3_LIMBS", 3)
+    rng = random.Random(p)
+    for i in range(50):
+        n1 = random_number(p, rng.randrange(1, 600), rng)
+        n2 = random_number(p, rng.randrange(1, 600), rng)
+        assert operations.multiply(p, n1, n2) == from_integer(p, to_integer(p, n1) * to_integer(p, n2))
+
+
+@pytest.mark.parametrize("p", BASES)
+@pytest.mark.parametrize("newton_bits", [operations.NEWTON_DIVISION_BITS, 1])
+def test_divide(p, newton_bits, monkeypatch):
+    monkeypatch.setattr(operations, "NEWTON_DIVISION_BITS", newton_bits)  # With 1, every division uses Newton
+    rng = random.Random(p)
+    for i in range(20):
+        n1 = random_number(p, rng.randrange(1, 3000), rng)
+        n2 = random_number(p, rng.randrange(1, 1500), rng)
+        precision = rng.randrange(0, 20)
+        quotient, remainder = operations.divide(p, n1, n2, precision)
+        q, r = divmod(to_integer(p, n1) * p ** precision, to_integer(p, n2))
+        integer_part, point, fractional_part = quotient.partition(".")
+        assert to_integer(p, integer_part + fractional_part.ljust(precision, "0")) == q
+        assert remainder == from_integer(p, r)